@@ -5,36 +5,149 @@ Demonstrates ALL capabilities working together in real-time
 Author: David Akpoviroro Oke (MrIridescent)
 """
 
+import argparse
 import asyncio
+import hashlib
+import functools
+import importlib
+import importlib.util
 import json
+import os
 import sys
+import time
 from datetime import datetime
-from typing import Dict, List, Any
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
 
-try:
-    from multidimensional_reasoning_engines import (
-        MultiDimensionalReasoningSystem,
-        RationalReasoningEngine,
-        RelationalReasoningEngine,
-        SubjectiveReasoningEngine,
-        ObjectiveReasoningEngine,
-    )
-    from unified_cognition_v5 import UnifiedCognitionV5
-    from emotional_intelligence_system import EmotionalIntelligenceEngine
-    from voice_emotion_detection import VoiceEmotionDetectionSystem
-    from facial_emotion_recognition import FacialEmotionRecognitionSystem
-    from human_communication_engine import HumanCommunicationEngine
-    from multilingual_system import MultilingualSystem
-    from enhanced_memory_system import EnhancedMemorySystem
-except ImportError as e:
-    print(f"⚠️  Warning: Some modules not available: {e}")
-    print("   Running basic verification instead...")
+# Symbol name -> imported object, or None when it could not be imported
+MODULES: Dict[str, Any] = {}
+
+
+def _optional_import(module_name: str, *names: str) -> Tuple[Any, ...]:
+    """Import names from a module, recording missing ones as None in MODULES"""
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        module = None
+    for name in names:
+        MODULES[name] = getattr(module, name, None)
+    return tuple(MODULES[name] for name in names)
+
+
+(
+    MultiDimensionalReasoningSystem,
+    RationalReasoningEngine,
+    RelationalReasoningEngine,
+    SubjectiveReasoningEngine,
+    ObjectiveReasoningEngine,
+) = _optional_import(
+    "multidimensional_reasoning_engines",
+    "MultiDimensionalReasoningSystem",
+    "RationalReasoningEngine",
+    "RelationalReasoningEngine",
+    "SubjectiveReasoningEngine",
+    "ObjectiveReasoningEngine",
+)
+(UnifiedCognitionV5,) = _optional_import("unified_cognition_v5", "UnifiedCognitionV5")
+(EmotionalIntelligenceEngine,) = _optional_import("emotional_intelligence_system", "EmotionalIntelligenceEngine")
+(VoiceEmotionDetectionSystem,) = _optional_import("voice_emotion_detection", "VoiceEmotionDetectionSystem")
+(FacialEmotionRecognitionSystem,) = _optional_import("facial_emotion_recognition", "FacialEmotionRecognitionSystem")
+(HumanCommunicationEngine,) = _optional_import("human_communication_engine", "HumanCommunicationEngine")
+(MultilingualSystem,) = _optional_import("multilingual_system", "MultilingualSystem")
+(EnhancedMemorySystem,) = _optional_import("enhanced_memory_system", "EnhancedMemorySystem")
+
+_missing = [name for name, obj in MODULES.items() if obj is None]
+if _missing:
+    print(f"⚠️  Warning: Some modules not available: {', '.join(_missing)}")
+    print("   Tests that need them will be skipped...")
+
+# Passing results are reused until the modules a test exercises change
+CACHE_DIR = Path.home() / ".cache" / "ochuko_verify"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+RESULTS_PATH = Path("verification_results.json")
+PERCEPTION_TIMEOUT_SECONDS = 5.0
+
+# Failures a test reports inline; anything else propagates to run_complete_verification
+ENGINE_ERRORS = (RuntimeError, ValueError, AttributeError, KeyError, TypeError, asyncio.TimeoutError)
+
+# Fixed moments fed to UnifiedCognitionV5.process_moment
+INTERVIEW_MOMENT = {
+    "text": "I'm excited but nervous about my job interview tomorrow",
+    "voice_data": {"pitch": 160, "volume": 75},
+    "context": {"situation": "job_interview", "time_until": "24_hours"}
+}
+CAREER_CHANGE_MOMENT = {
+    "text": "I want to change careers but I'm afraid of the risk",
+    "emotion": "mixed"
+}
+
+STATUS_SYMBOL = {"PASS": "✅", "PARTIAL": "⚠️", "SKIPPED": "⏭️", "FAIL": "❌"}
+
+
+class ResultEncoder(json.JSONEncoder):
+    """Flatten engine result objects instead of stringifying them"""
+    
+    def default(self, o):
+        if isinstance(o, Enum):
+            return o.value
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if hasattr(o, "__dict__"):
+            return o.__dict__
+        return str(o)
+
+# test method -> (results section, result key, modules it exercises)
+CACHEABLE_TESTS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "test_reasoning_systems": ("systems", "reasoning", ("multidimensional_reasoning_engines",)),
+    "test_emotional_intelligence": ("systems", "emotional_intelligence", ("emotional_intelligence_system",)),
+    "test_perception_systems": ("systems", "perception", ("voice_emotion_detection", "facial_emotion_recognition")),
+    "test_communication": ("systems", "communication", ("human_communication_engine",)),
+    "test_unified_cognition": ("systems", "unified_cognition", ("unified_cognition_v5",)),
+    "test_mcp_integration": ("integration_tests", "mcp", ()),
+    "test_crewai_integration": ("integration_tests", "crewai", ()),
+    "test_memory_systems": ("systems", "memory", ("enhanced_memory_system",)),
+    "test_complete_integration": ("integration_tests", "complete", ("unified_cognition_v5",)),
+}
+
+
+def _source_hash(module_names: Tuple[str, ...]) -> str:
+    """Hash this suite, the given modules' sources and the interpreter version"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(Path(__file__).read_bytes())
+    digest.update(sys.version.encode())
+    for name in module_names:
+        digest.update(name.encode())
+        spec = importlib.util.find_spec(name)
+        if spec is not None and spec.origin and Path(spec.origin).is_file():
+            digest.update(Path(spec.origin).read_bytes())
+    return digest.hexdigest()
+
+
+def requires(*names: str, any_of: bool = False):
+    """
+    Mark a test SKIPPED up front when any symbol it needs failed to import.
+    With any_of, the test runs while at least one symbol is available and
+    gates its own sub-checks on the rest.
+    """
+    def decorator(test):
+        @functools.wraps(test)
+        async def wrapper(self):
+            missing = [name for name in names if MODULES.get(name) is None]
+            if not missing or (any_of and len(missing) < len(names)):
+                return await test(self)
+            section, key, _ = CACHEABLE_TESTS[test.__name__]
+            self._record(section, key, {"status": "SKIPPED", "missing": missing})
+            print(f"\n⏭️  {key.replace('_', ' ').title()}: skipped, missing {', '.join(missing)}")
+        return wrapper
+    return decorator
 
 
 class OchukoVerificationSuite:
     """Complete verification of all Ochuko AI systems"""
     
-    def __init__(self):
+    def __init__(self, force: bool = False):
+        self.force = force
         self.results = {
             "timestamp": datetime.now().isoformat(),
             "systems": {},
@@ -42,6 +155,85 @@ class OchukoVerificationSuite:
             "performance": {},
             "overall_status": "UNKNOWN"
         }
+        self._engines: Dict[type, Any] = {}
+        self._passed = 0
+        self._total = 0
+    
+    def _get(self, cls):
+        """Return the suite-wide instance of an engine, constructing it once"""
+        if cls not in self._engines:
+            self._engines[cls] = cls()
+        return self._engines[cls]
+    
+    def _record(self, section: str, key: str, result: Dict[str, Any]):
+        """Store a test result and keep the pass/total counters current"""
+        previous = self.results[section].get(key)
+        if previous is None:
+            self._total += 1
+        else:
+            self._passed -= previous.get("status") == "PASS"
+        self.results[section][key] = result
+        self._passed += result.get("status") == "PASS"
+    
+    def _emit(self, buf: List[str], line: str):
+        buf.append(line)
+    
+    def _flush(self, buf: List[str]):
+        """Write a test's buffered report in one call so concurrent tests don't interleave"""
+        sys.stdout.write("\n".join(buf) + "\n")
+        sys.stdout.flush()
+    
+    def _cache_path(self, test_name: str) -> Path:
+        _, _, modules = CACHEABLE_TESTS[test_name]
+        return CACHE_DIR / f"{test_name}-{_source_hash(modules)}.json"
+    
+    def _load_cached(self, test_name: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached result for the test, if one exists"""
+        path = self._cache_path(test_name)
+        try:
+            if time.time() - path.stat().st_mtime > CACHE_TTL_SECONDS:
+                return None
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _store_cached(self, test_name: str, result: Dict[str, Any]):
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path(test_name), "w") as f:
+                json.dump(result, f, cls=ResultEncoder)
+        except OSError:
+            pass  # Caching is best-effort
+    
+    async def _run_cached(self, test):
+        """Run a test unless a passing result for the same sources is cached"""
+        name = test.__name__
+        section, key, _ = CACHEABLE_TESTS[name]
+        
+        if not self.force:
+            cached = self._load_cached(name)
+            if cached is not None:
+                self._record(section, key, cached)
+                print(f"\n♻️  {key.replace('_', ' ').title()}: reusing cached {cached['status']} (sources unchanged)")
+                self._save_results()
+                return
+        
+        try:
+            await test()
+        finally:
+            # Persist partial progress so a crash later in the run keeps it
+            self._save_results()
+        result = self.results[section].get(key)
+        if result is not None and result.get("status") == "PASS":
+            self._store_cached(name, result)
+    
+    def _save_results(self):
+        """Atomically rewrite the results file with the current state"""
+        tmp_path = RESULTS_PATH.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.results, f, indent=2, cls=ResultEncoder)
+        os.replace(tmp_path, RESULTS_PATH)
     
     async def run_complete_verification(self):
         """Run complete system verification"""
@@ -50,20 +242,31 @@ class OchukoVerificationSuite:
         print("="*70)
         
         try:
-            # Test individual systems
-            await self.test_reasoning_systems()
-            await self.test_emotional_intelligence()
-            await self.test_perception_systems()
-            await self.test_communication()
-            await self.test_unified_cognition()
-            
-            # Test integrations
-            await self.test_mcp_integration()
-            await self.test_crewai_integration()
-            await self.test_memory_systems()
-            
+            # Individual systems and integrations touch independent engines,
+            # so run them concurrently; each test buffers its own output
+            independent_tests = [
+                self.test_reasoning_systems,
+                self.test_emotional_intelligence,
+                self.test_perception_systems,
+                self.test_communication,
+                self.test_unified_cognition,
+                self.test_mcp_integration,
+                self.test_crewai_integration,
+                self.test_memory_systems,
+            ]
+            results = await asyncio.gather(
+                *(self._run_cached(test) for test in independent_tests),
+                return_exceptions=True
+            )
+            for test, result in zip(independent_tests, results):
+                if isinstance(result, BaseException):
+                    # Unexpected errors escape the test's own handler
+                    section, key, _ = CACHEABLE_TESTS[test.__name__]
+                    print(f"\n❌ {key.replace('_', ' ').title()}: {result!r}")
+                    self._record(section, key, {"status": "FAIL", "error": repr(result)})
+
             # Comprehensive integration test
-            await self.test_complete_integration()
+            await self._run_cached(self.test_complete_integration)
             
             # Print summary
             self.print_summary()
@@ -72,389 +275,457 @@ class OchukoVerificationSuite:
             print(f"\n❌ Verification failed: {e}")
             self.results["overall_status"] = "FAILED"
     
+    @requires("RationalReasoningEngine", "RelationalReasoningEngine",
+              "SubjectiveReasoningEngine", "ObjectiveReasoningEngine")
     async def test_reasoning_systems(self):
         """Test all 4 reasoning engines"""
-        print("\n" + "-"*70)
-        print("🧠 Testing Multidimensional Reasoning Systems...")
-        print("-"*70)
-        
-        tests_passed = 0
-        tests_total = 4
-        
-        try:
-            # Rational Reasoning
-            print("\n  [1/4] Rational Reasoning Engine")
-            rational_engine = RationalReasoningEngine()
-            rational_result = await rational_engine.reason_rationally(
-                "All humans are mortal. Socrates is human."
-            )
-            print(f"       ✅ Validity: {rational_result.validity:.0%}")
-            print(f"       ✅ Logic chain steps: {len(rational_result.logic_chain)}")
-            tests_passed += 1
-            
-        except Exception as e:
-            print(f"       ❌ Error: {e}")
-        
-        try:
-            # Relational Reasoning
-            print("\n  [2/4] Relational Reasoning Engine")
-            relational_engine = RelationalReasoningEngine()
-            relational_result = await relational_engine.reason_relationally(
-                "How to resolve conflict in a team"
-            )
-            print(f"       ✅ Completeness: {relational_result.completeness:.0%}")
-            print(f"       ✅ Perspective: Care-based reasoning applied")
-            tests_passed += 1
-            
-        except Exception as e:
-            print(f"       ❌ Error: {e}")
-        
+        buf: List[str] = []
         try:
-            # Subjective Reasoning
-            print("\n  [3/4] Subjective Reasoning Engine")
-            subjective_engine = SubjectiveReasoningEngine()
-            subjective_result = await subjective_engine.reason_subjectively(
-                "What gives life meaning"
-            )
-            print(f"       ✅ Completeness: {subjective_result.completeness:.0%}")
-            print(f"       ✅ Perspective: Value-based reasoning applied")
-            tests_passed += 1
-            
-        except Exception as e:
-            print(f"       ❌ Error: {e}")
-        
-        try:
-            # Objective Reasoning
-            print("\n  [4/4] Objective Reasoning Engine")
-            objective_engine = ObjectiveReasoningEngine()
-            objective_result = await objective_engine.reason_objectively(
-                "Climate change evidence"
-            )
-            print(f"       ✅ Validity: {objective_result.validity:.0%}")
-            print(f"       ✅ Perspective: Evidence-based reasoning applied")
-            tests_passed += 1
-            
-        except Exception as e:
-            print(f"       ❌ Error: {e}")
-        
-        self.results["systems"]["reasoning"] = {
-            "tests_passed": tests_passed,
-            "tests_total": tests_total,
-            "status": "PASS" if tests_passed == tests_total else "PARTIAL"
-        }
-        print(f"\n  Summary: {tests_passed}/{tests_total} reasoning systems verified ✅")
+            self._emit(buf, "\n" + "-"*70)
+            self._emit(buf, "🧠 Testing Multidimensional Reasoning Systems...")
+            self._emit(buf, "-"*70)
+            
+            # The four engines are independent, so reason with all of them at once
+            coros = [
+                self._get(RationalReasoningEngine).reason_rationally(
+                    "All humans are mortal. Socrates is human."
+                ),
+                self._get(RelationalReasoningEngine).reason_relationally(
+                    "How to resolve conflict in a team"
+                ),
+                self._get(SubjectiveReasoningEngine).reason_subjectively(
+                    "What gives life meaning"
+                ),
+                self._get(ObjectiveReasoningEngine).reason_objectively(
+                    "Climate change evidence"
+                ),
+            ]
+            reports = [
+                ("Rational Reasoning Engine", lambda r: [
+                    f"Validity: {r.validity:.0%}",
+                    f"Logic chain steps: {len(r.logic_chain)}",
+                ]),
+                ("Relational Reasoning Engine", lambda r: [
+                    f"Completeness: {r.completeness:.0%}",
+                    "Perspective: Care-based reasoning applied",
+                ]),
+                ("Subjective Reasoning Engine", lambda r: [
+                    f"Completeness: {r.completeness:.0%}",
+                    "Perspective: Value-based reasoning applied",
+                ]),
+                ("Objective Reasoning Engine", lambda r: [
+                    f"Validity: {r.validity:.0%}",
+                    "Perspective: Evidence-based reasoning applied",
+                ]),
+            ]
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            
+            tests_passed = 0
+            tests_total = len(coros)
+            
+            for index, ((label, describe), result) in enumerate(zip(reports, results), 1):
+                self._emit(buf, f"\n  [{index}/{tests_total}] {label}")
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+                    for line in describe(result):
+                        self._emit(buf, f"       ✅ {line}")
+                    tests_passed += 1
+                    
+                except ENGINE_ERRORS as e:
+                    self._emit(buf, f"       ❌ Error: {e}")
+            
+            self._record("systems", "reasoning", {
+                "tests_passed": tests_passed,
+                "tests_total": tests_total,
+                "status": "PASS" if tests_passed == tests_total else "PARTIAL"
+            })
+            self._emit(buf, f"\n  Summary: {tests_passed}/{tests_total} reasoning systems verified ✅")
+        finally:
+            self._flush(buf)
     
+    @requires("EmotionalIntelligenceEngine")
     async def test_emotional_intelligence(self):
         """Test emotional intelligence system"""
-        print("\n" + "-"*70)
-        print("❤️  Testing Emotional Intelligence System...")
-        print("-"*70)
-        
+        buf: List[str] = []
         try:
-            engine = EmotionalIntelligenceEngine()
-            
-            # Test 1: Basic emotion detection
-            print("\n  [1/3] Emotion Detection")
-            emotions = await engine.analyze_emotions("I'm feeling wonderful and hopeful!")
-            print(f"       ✅ Detected {len(emotions)} emotions")
-            for emotion in emotions[:3]:
-                print(f"          - {emotion.emotion_type}: {emotion.intensity:.0%}")
-            
-            # Test 2: Emotional authenticity
-            print("\n  [2/3] Emotional Authenticity Detection")
-            authenticity = await engine.assess_emotional_authenticity(
-                "I'm so happy", "neutral_tone"
-            )
-            print(f"       ✅ Authenticity score: {authenticity:.0%}")
-            
-            # Test 3: Emotional resilience
-            print("\n  [3/3] Emotional Resilience Assessment")
-            resilience = await engine.assess_emotional_resilience(["joy", "sadness", "fear"])
-            print(f"       ✅ Resilience score: {resilience:.0%}")
-            
-            self.results["systems"]["emotional_intelligence"] = {"status": "PASS"}
-            print(f"\n  Summary: Emotional intelligence system fully operational ✅")
-            
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            self.results["systems"]["emotional_intelligence"] = {"status": "FAIL"}
+            self._emit(buf, "\n" + "-"*70)
+            self._emit(buf, "❤️  Testing Emotional Intelligence System...")
+            self._emit(buf, "-"*70)
+            
+            try:
+                engine = self._get(EmotionalIntelligenceEngine)
+                
+                # Test 1: Basic emotion detection
+                self._emit(buf, "\n  [1/3] Emotion Detection")
+                emotions = await engine.analyze_emotions("I'm feeling wonderful and hopeful!")
+                self._emit(buf, f"       ✅ Detected {len(emotions)} emotions")
+                for emotion in emotions[:3]:
+                    self._emit(buf, f"          - {emotion.emotion_type}: {emotion.intensity:.0%}")
+                
+                # Test 2: Emotional authenticity
+                self._emit(buf, "\n  [2/3] Emotional Authenticity Detection")
+                authenticity = await engine.assess_emotional_authenticity(
+                    "I'm so happy", "neutral_tone"
+                )
+                self._emit(buf, f"       ✅ Authenticity score: {authenticity:.0%}")
+                
+                # Test 3: Emotional resilience
+                self._emit(buf, "\n  [3/3] Emotional Resilience Assessment")
+                resilience = await engine.assess_emotional_resilience(["joy", "sadness", "fear"])
+                self._emit(buf, f"       ✅ Resilience score: {resilience:.0%}")
+                
+                self._record("systems", "emotional_intelligence", {"status": "PASS"})
+                self._emit(buf, f"\n  Summary: Emotional intelligence system fully operational ✅")
+                
+            except ENGINE_ERRORS as e:
+                self._emit(buf, f"  ❌ Error: {e}")
+                self._record("systems", "emotional_intelligence", {"status": "FAIL"})
+        finally:
+            self._flush(buf)
     
+    @requires("VoiceEmotionDetectionSystem", "FacialEmotionRecognitionSystem", any_of=True)
     async def test_perception_systems(self):
-        """Test voice and facial emotion detection"""
-        print("\n" + "-"*70)
-        print("👁️  Testing Perception Systems...")
-        print("-"*70)
-        
-        tests_passed = 0
-        
+        """Test voice and facial emotion detection; each check runs if its own module imported"""
+        buf: List[str] = []
         try:
-            print("\n  [1/2] Voice Emotion Detection")
-            voice_system = VoiceEmotionDetectionSystem()
-            voice_analysis = await voice_system.analyze_voice_emotion(
-                {"pitch": 150, "volume": 70, "speed": 160}
+            self._emit(buf, "\n" + "-"*70)
+            self._emit(buf, "👁️  Testing Perception Systems...")
+            self._emit(buf, "-"*70)
+            
+            async def analyze_voice():
+                if VoiceEmotionDetectionSystem is None:
+                    return None
+                voice_system = self._get(VoiceEmotionDetectionSystem)
+                return await asyncio.wait_for(
+                    voice_system.analyze_voice_emotion({"pitch": 150, "volume": 70, "speed": 160}),
+                    PERCEPTION_TIMEOUT_SECONDS
+                )
+            
+            async def analyze_face():
+                if FacialEmotionRecognitionSystem is None:
+                    return None
+                facial_system = self._get(FacialEmotionRecognitionSystem)
+                return await asyncio.wait_for(
+                    facial_system.analyze_facial_emotion(
+                        {"eye_openness": 0.8, "mouth_openness": 0.6, "brow_position": 0.4}
+                    ),
+                    PERCEPTION_TIMEOUT_SECONDS
+                )
+            
+            # Voice and facial analysis are independent; a hung backend is bounded by the timeout
+            voice_analysis, facial_analysis = await asyncio.gather(
+                analyze_voice(), analyze_face(), return_exceptions=True
             )
-            print(f"       ✅ Emotion detected: {voice_analysis.detected_emotion.value}")
-            print(f"       ✅ Confidence: {voice_analysis.emotion_confidence:.0%}")
-            print(f"       ✅ Arousal level: {voice_analysis.arousal_level:.0%}")
-            print(f"       ✅ Valence: {voice_analysis.valence_level:.0%}")
-            tests_passed += 1
             
-        except Exception as e:
-            print(f"       ⚠️  Voice system not fully available: {e}")
-        
-        try:
-            print("\n  [2/2] Facial Emotion Recognition")
-            facial_system = FacialEmotionRecognitionSystem()
-            facial_analysis = await facial_system.analyze_facial_emotion(
-                {"eye_openness": 0.8, "mouth_openness": 0.6, "brow_position": 0.4}
-            )
-            print(f"       ✅ Emotion detected: {facial_analysis.primary_emotion.value}")
-            print(f"       ✅ Confidence: {facial_analysis.emotion_confidence:.0%}")
-            print(f"       ✅ Emotional intensity: {facial_analysis.emotional_intensity:.0%}")
-            print(f"       ✅ Expression symmetry: {facial_analysis.expression_symmetry:.0%}")
-            tests_passed += 1
-            
-        except Exception as e:
-            print(f"       ⚠️  Facial system not fully available: {e}")
-        
-        self.results["systems"]["perception"] = {
-            "tests_passed": tests_passed,
-            "status": "PARTIAL" if tests_passed < 2 else "PASS"
-        }
-        print(f"\n  Summary: {tests_passed}/2 perception systems operational")
+            tests_passed = 0
+            
+            try:
+                self._emit(buf, "\n  [1/2] Voice Emotion Detection")
+                if isinstance(voice_analysis, Exception):
+                    raise voice_analysis
+                if voice_analysis is None:
+                    self._emit(buf, "       ⏭️  Skipped, missing VoiceEmotionDetectionSystem")
+                else:
+                    self._emit(buf, f"       ✅ Emotion detected: {voice_analysis.detected_emotion.value}")
+                    self._emit(buf, f"       ✅ Confidence: {voice_analysis.emotion_confidence:.0%}")
+                    self._emit(buf, f"       ✅ Arousal level: {voice_analysis.arousal_level:.0%}")
+                    self._emit(buf, f"       ✅ Valence: {voice_analysis.valence_level:.0%}")
+                    tests_passed += 1
+                
+            except ENGINE_ERRORS as e:
+                self._emit(buf, f"       ⚠️  Voice system not fully available: {e!r}")
+            
+            try:
+                self._emit(buf, "\n  [2/2] Facial Emotion Recognition")
+                if isinstance(facial_analysis, Exception):
+                    raise facial_analysis
+                if facial_analysis is None:
+                    self._emit(buf, "       ⏭️  Skipped, missing FacialEmotionRecognitionSystem")
+                else:
+                    self._emit(buf, f"       ✅ Emotion detected: {facial_analysis.primary_emotion.value}")
+                    self._emit(buf, f"       ✅ Confidence: {facial_analysis.emotion_confidence:.0%}")
+                    self._emit(buf, f"       ✅ Emotional intensity: {facial_analysis.emotional_intensity:.0%}")
+                    self._emit(buf, f"       ✅ Expression symmetry: {facial_analysis.expression_symmetry:.0%}")
+                    tests_passed += 1
+                
+            except ENGINE_ERRORS as e:
+                self._emit(buf, f"       ⚠️  Facial system not fully available: {e!r}")
+            
+            self._record("systems", "perception", {
+                "tests_passed": tests_passed,
+                "status": "PARTIAL" if tests_passed < 2 else "PASS"
+            })
+            self._emit(buf, f"\n  Summary: {tests_passed}/2 perception systems operational")
+        finally:
+            self._flush(buf)
     
+    @requires("HumanCommunicationEngine")
     async def test_communication(self):
         """Test multilingual communication"""
-        print("\n" + "-"*70)
-        print("🌐 Testing Communication Systems...")
-        print("-"*70)
-        
+        buf: List[str] = []
         try:
-            comm_engine = HumanCommunicationEngine()
-            
-            print("\n  [1/2] Natural Language Understanding")
-            understanding = await comm_engine.understand_user_intent(
-                "I'd like to create a business but I'm worried about failing"
-            )
-            print(f"       ✅ Identified intent: {understanding.get('primary_intent', 'unknown')}")
-            print(f"       ✅ Emotional context: {understanding.get('emotional_context', 'unknown')}")
-            print(f"       ✅ Hidden needs: {len(understanding.get('hidden_needs', []))} identified")
-            
-            print("\n  [2/2] Human-Like Response Generation")
-            response = await comm_engine.generate_response(
-                "I feel stuck in my career",
-                context={"user_mood": "uncertain", "previous_topics": []}
-            )
-            print(f"       ✅ Response generated ({len(response)} characters)")
-            print(f"       ✅ Tone preserved: natural and empathetic")
-            print(f"       ✅ Contextually appropriate")
-            
-            self.results["systems"]["communication"] = {"status": "PASS"}
-            print(f"\n  Summary: Communication systems fully operational ✅")
-            
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            self.results["systems"]["communication"] = {"status": "FAIL"}
+            self._emit(buf, "\n" + "-"*70)
+            self._emit(buf, "🌐 Testing Communication Systems...")
+            self._emit(buf, "-"*70)
+            
+            try:
+                comm_engine = self._get(HumanCommunicationEngine)
+                
+                self._emit(buf, "\n  [1/2] Natural Language Understanding")
+                understanding = await comm_engine.understand_user_intent(
+                    "I'd like to create a business but I'm worried about failing"
+                )
+                self._emit(buf, f"       ✅ Identified intent: {understanding.get('primary_intent', 'unknown')}")
+                self._emit(buf, f"       ✅ Emotional context: {understanding.get('emotional_context', 'unknown')}")
+                self._emit(buf, f"       ✅ Hidden needs: {len(understanding.get('hidden_needs', []))} identified")
+                
+                self._emit(buf, "\n  [2/2] Human-Like Response Generation")
+                # Hand over the NLU result so the engine can skip re-parsing intent
+                response = await comm_engine.generate_response(
+                    "I feel stuck in my career",
+                    context={"user_mood": "uncertain", "previous_topics": [], "intent": understanding}
+                )
+                self._emit(buf, f"       ✅ Response generated ({len(response)} characters)")
+                self._emit(buf, f"       ✅ Tone preserved: natural and empathetic")
+                self._emit(buf, f"       ✅ Contextually appropriate")
+                
+                self._record("systems", "communication", {"status": "PASS"})
+                self._emit(buf, f"\n  Summary: Communication systems fully operational ✅")
+                
+            except ENGINE_ERRORS as e:
+                self._emit(buf, f"  ❌ Error: {e}")
+                self._record("systems", "communication", {"status": "FAIL"})
+        finally:
+            self._flush(buf)
     
+    @requires("UnifiedCognitionV5")
     async def test_unified_cognition(self):
         """Test complete unified cognition v5.0"""
-        print("\n" + "-"*70)
-        print("🧬 Testing Unified Cognition v5.0...")
-        print("-"*70)
-        
+        buf: List[str] = []
         try:
-            cognition = UnifiedCognitionV5()
-            
-            print("\n  Processing moment with all systems simultaneously...")
-            moment = await cognition.process_moment({
-                "text": "I'm excited but nervous about my job interview tomorrow",
-                "voice_data": {"pitch": 160, "volume": 75},
-                "context": {"situation": "job_interview", "time_until": "24_hours"}
-            })
-            
-            print(f"\n  ✅ Unified processing complete")
-            print(f"     - Overall intelligence: 91.8%")
-            print(f"     - Confidence level: {moment.confidence_level:.0%}")
-            print(f"     - Depth of understanding: {moment.depth_of_understanding:.0%}")
-            print(f"     - Response quality: {len(moment.unified_understanding)} characters")
-            print(f"     - Hidden insights identified: {len(moment.deductive_insights)}")
-            
-            print(f"\n  🧠 Insights extracted:")
-            for insight in moment.deductive_insights[:3]:
-                print(f"     - {insight}")
-            
-            self.results["systems"]["unified_cognition"] = {
-                "status": "PASS",
-                "intelligence_score": 0.918,
-                "confidence": moment.confidence_level,
-                "depth": moment.depth_of_understanding
-            }
-            print(f"\n  Summary: Unified cognition fully integrated ✅")
-            
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            self.results["systems"]["unified_cognition"] = {"status": "FAIL"}
+            self._emit(buf, "\n" + "-"*70)
+            self._emit(buf, "🧬 Testing Unified Cognition v5.0...")
+            self._emit(buf, "-"*70)
+            
+            try:
+                cognition = self._get(UnifiedCognitionV5)
+                
+                self._emit(buf, "\n  Processing moment with all systems simultaneously...")
+                moment = await cognition.process_moment(INTERVIEW_MOMENT)
+                
+                self._emit(buf, f"\n  ✅ Unified processing complete")
+                self._emit(buf, f"     - Overall intelligence: 91.8%")
+                self._emit(buf, f"     - Confidence level: {moment.confidence_level:.0%}")
+                self._emit(buf, f"     - Depth of understanding: {moment.depth_of_understanding:.0%}")
+                self._emit(buf, f"     - Response quality: {len(moment.unified_understanding)} characters")
+                self._emit(buf, f"     - Hidden insights identified: {len(moment.deductive_insights)}")
+                
+                self._emit(buf, f"\n  🧠 Insights extracted:")
+                for insight in moment.deductive_insights[:3]:
+                    self._emit(buf, f"     - {insight}")
+                
+                self._record("systems", "unified_cognition", {
+                    "status": "PASS",
+                    "intelligence_score": 0.918,
+                    "confidence": moment.confidence_level,
+                    "depth": moment.depth_of_understanding
+                })
+                self._emit(buf, f"\n  Summary: Unified cognition fully integrated ✅")
+                
+            except ENGINE_ERRORS as e:
+                self._emit(buf, f"  ❌ Error: {e}")
+                self._record("systems", "unified_cognition", {"status": "FAIL"})
+        finally:
+            self._flush(buf)
     
     async def test_mcp_integration(self):
         """Test MCP Server integration"""
-        print("\n" + "-"*70)
-        print("🔌 Testing MCP (Model Context Protocol) Integration...")
-        print("-"*70)
-        
+        buf: List[str] = []
         try:
-            print("\n  ✅ MCP Server operational")
-            print("     - 50+ tools registered")
-            print("     - Reasoning tools: ✅ (10 tools)")
-            print("     - Analysis tools: ✅ (8 tools)")
-            print("     - Memory tools: ✅ (6 tools)")
-            print("     - Integration tools: ✅ (12 tools)")
-            print("     - Social tools: ✅ (8 tools)")
-            print("     - Action tools: ✅ (6 tools)")
-            
-            print("\n  ✅ Protocol compliance verified")
-            print("     - JSON-RPC 2.0: ✅")
-            print("     - Tool invocation: ✅")
-            print("     - Resource management: ✅")
-            print("     - Error handling: ✅")
-            
-            self.results["integration_tests"]["mcp"] = {"status": "PASS"}
-            print(f"\n  Summary: MCP integration fully functional ✅")
-            
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            self.results["integration_tests"]["mcp"] = {"status": "FAIL"}
+            self._emit(buf, "\n" + "-"*70)
+            self._emit(buf, "🔌 Testing MCP (Model Context Protocol) Integration...")
+            self._emit(buf, "-"*70)
+            
+            try:
+                self._emit(buf, "\n  ✅ MCP Server operational")
+                self._emit(buf, "     - 50+ tools registered")
+                self._emit(buf, "     - Reasoning tools: ✅ (10 tools)")
+                self._emit(buf, "     - Analysis tools: ✅ (8 tools)")
+                self._emit(buf, "     - Memory tools: ✅ (6 tools)")
+                self._emit(buf, "     - Integration tools: ✅ (12 tools)")
+                self._emit(buf, "     - Social tools: ✅ (8 tools)")
+                self._emit(buf, "     - Action tools: ✅ (6 tools)")
+                
+                self._emit(buf, "\n  ✅ Protocol compliance verified")
+                self._emit(buf, "     - JSON-RPC 2.0: ✅")
+                self._emit(buf, "     - Tool invocation: ✅")
+                self._emit(buf, "     - Resource management: ✅")
+                self._emit(buf, "     - Error handling: ✅")
+                
+                self._record("integration_tests", "mcp", {"status": "PASS"})
+                self._emit(buf, f"\n  Summary: MCP integration fully functional ✅")
+                
+            except ENGINE_ERRORS as e:
+                self._emit(buf, f"  ❌ Error: {e}")
+                self._record("integration_tests", "mcp", {"status": "FAIL"})
+        finally:
+            self._flush(buf)
     
     async def test_crewai_integration(self):
         """Test CrewAI multi-agent system"""
-        print("\n" + "-"*70)
-        print("👥 Testing CrewAI Multi-Agent Integration...")
-        print("-"*70)
-        
+        buf: List[str] = []
         try:
-            print("\n  ✅ CrewAI agents operational")
-            print("     - Emotional Intelligence Agent: ✅")
-            print("     - Reasoning Agent: ✅")
-            print("     - Social Intelligence Agent: ✅")
-            print("     - Action Planning Agent: ✅")
-            print("     - Integration Coordinator: ✅")
-            
-            print("\n  ✅ Agent capabilities")
-            print("     - Sequential execution: ✅")
-            print("     - Parallel execution: ✅")
-            print("     - Hierarchical coordination: ✅")
-            print("     - Memory sharing: ✅")
-            print("     - Tool access: ✅")
-            
-            self.results["integration_tests"]["crewai"] = {"status": "PASS"}
-            print(f"\n  Summary: CrewAI integration fully operational ✅")
-            
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            self.results["integration_tests"]["crewai"] = {"status": "FAIL"}
+            self._emit(buf, "\n" + "-"*70)
+            self._emit(buf, "👥 Testing CrewAI Multi-Agent Integration...")
+            self._emit(buf, "-"*70)
+            
+            try:
+                self._emit(buf, "\n  ✅ CrewAI agents operational")
+                self._emit(buf, "     - Emotional Intelligence Agent: ✅")
+                self._emit(buf, "     - Reasoning Agent: ✅")
+                self._emit(buf, "     - Social Intelligence Agent: ✅")
+                self._emit(buf, "     - Action Planning Agent: ✅")
+                self._emit(buf, "     - Integration Coordinator: ✅")
+                
+                self._emit(buf, "\n  ✅ Agent capabilities")
+                self._emit(buf, "     - Sequential execution: ✅")
+                self._emit(buf, "     - Parallel execution: ✅")
+                self._emit(buf, "     - Hierarchical coordination: ✅")
+                self._emit(buf, "     - Memory sharing: ✅")
+                self._emit(buf, "     - Tool access: ✅")
+                
+                self._record("integration_tests", "crewai", {"status": "PASS"})
+                self._emit(buf, f"\n  Summary: CrewAI integration fully operational ✅")
+                
+            except ENGINE_ERRORS as e:
+                self._emit(buf, f"  ❌ Error: {e}")
+                self._record("integration_tests", "crewai", {"status": "FAIL"})
+        finally:
+            self._flush(buf)
     
+    @requires("EnhancedMemorySystem")
     async def test_memory_systems(self):
         """Test memory systems"""
-        print("\n" + "-"*70)
-        print("🧠 Testing Memory Systems...")
-        print("-"*70)
-        
+        buf: List[str] = []
         try:
-            memory = EnhancedMemorySystem()
-            
-            print("\n  [1/3] Episodic Memory")
-            await memory.store_episodic("test_event", {"data": "event_data"})
-            retrieved = await memory.retrieve_episodic("test_event")
-            print(f"       ✅ Episodic storage and retrieval working")
-            
-            print("\n  [2/3] Semantic Memory")
-            await memory.store_semantic("concept_key", {"meaning": "definition"})
-            print(f"       ✅ Semantic storage working")
-            
-            print("\n  [3/3] Procedural Memory")
-            await memory.store_procedural("skill", {"steps": ["step1", "step2"]})
-            print(f"       ✅ Procedural memory working")
-            
-            self.results["systems"]["memory"] = {"status": "PASS"}
-            print(f"\n  Summary: All memory systems operational ✅")
-            
-        except Exception as e:
-            print(f"  ⚠️  Memory systems: {e}")
-            self.results["systems"]["memory"] = {"status": "PARTIAL"}
+            self._emit(buf, "\n" + "-"*70)
+            self._emit(buf, "🧠 Testing Memory Systems...")
+            self._emit(buf, "-"*70)
+            
+            try:
+                memory = self._get(EnhancedMemorySystem)
+                
+                # Only the episodic retrieval depends on the episodic store;
+                # the semantic and procedural stores run alongside it
+                await memory.store_episodic("test_event", {"data": "event_data"})
+                retrieved, semantic, procedural = await asyncio.gather(
+                    memory.retrieve_episodic("test_event"),
+                    memory.store_semantic("concept_key", {"meaning": "definition"}),
+                    memory.store_procedural("skill", {"steps": ["step1", "step2"]}),
+                    return_exceptions=True,
+                )
+                
+                self._emit(buf, "\n  [1/3] Episodic Memory")
+                if isinstance(retrieved, Exception):
+                    raise retrieved
+                self._emit(buf, f"       ✅ Episodic storage and retrieval working")
+                
+                self._emit(buf, "\n  [2/3] Semantic Memory")
+                if isinstance(semantic, Exception):
+                    raise semantic
+                self._emit(buf, f"       ✅ Semantic storage working")
+                
+                self._emit(buf, "\n  [3/3] Procedural Memory")
+                if isinstance(procedural, Exception):
+                    raise procedural
+                self._emit(buf, f"       ✅ Procedural memory working")
+                
+                self._record("systems", "memory", {"status": "PASS"})
+                self._emit(buf, f"\n  Summary: All memory systems operational ✅")
+                
+            except ENGINE_ERRORS as e:
+                self._emit(buf, f"  ⚠️  Memory systems: {e}")
+                self._record("systems", "memory", {"status": "PARTIAL"})
+        finally:
+            self._flush(buf)
     
+    @requires("UnifiedCognitionV5")
     async def test_complete_integration(self):
         """Test complete end-to-end integration"""
-        print("\n" + "-"*70)
-        print("🚀 Complete End-to-End Integration Test...")
-        print("-"*70)
-        
+        buf: List[str] = []
         try:
-            print("\n  Scenario: User seeks career advice with mixed emotions")
-            print("  Input: 'I want to change careers but I'm afraid of the risk'")
-            
-            # 1. Unified cognition processes input
-            print("\n  Phase 1: Unified Cognition Processing")
-            cognition = UnifiedCognitionV5()
-            moment = await cognition.process_moment({
-                "text": "I want to change careers but I'm afraid of the risk",
-                "emotion": "mixed"
-            })
-            print(f"       ✅ Input processed with {moment.confidence_level:.0%} confidence")
-            
-            # 2. MCP tools analyze
-            print("\n  Phase 2: MCP Analysis")
-            print("       ✅ Emotional analysis tool")
-            print("       ✅ Logic reasoning tool")
-            print("       ✅ Social context tool")
-            
-            # 3. CrewAI agents reason
-            print("\n  Phase 3: Multi-Agent Reasoning")
-            print("       ✅ Emotional agent analyzed fear factors")
-            print("       ✅ Reasoning agent evaluated career change logic")
-            print("       ✅ Social agent considered relationships impact")
-            print("       ✅ Action agent created transition plan")
-            print("       ✅ Coordinator synthesized response")
-            
-            # 4. Memory stores learning
-            print("\n  Phase 4: Memory Integration")
-            print("       ✅ Interaction stored in episodic memory")
-            print("       ✅ Insights added to semantic knowledge")
-            print("       ✅ Career transition process added to procedures")
-            
-            # 5. Response generation
-            print("\n  Phase 5: Response Generation")
-            print("       ✅ Human-like response created")
-            print("       ✅ Tone matched emotional state")
-            print("       ✅ Practical advice included")
-            print("       ✅ Empathy demonstrated")
-            
-            response = """Your fear is completely valid - career changes are significant risks.
-But I see something important here: you're willing to face that fear because 
-something matters more. That's courage.
+            self._emit(buf, "\n" + "-"*70)
+            self._emit(buf, "🚀 Complete End-to-End Integration Test...")
+            self._emit(buf, "-"*70)
+            
+            try:
+                self._emit(buf, "\n  Scenario: User seeks career advice with mixed emotions")
+                self._emit(buf, "  Input: 'I want to change careers but I'm afraid of the risk'")
+                
+                # 1. Unified cognition processes input
+                self._emit(buf, "\n  Phase 1: Unified Cognition Processing")
+                cognition = self._get(UnifiedCognitionV5)
+                moment = await cognition.process_moment(CAREER_CHANGE_MOMENT)
+                self._emit(buf, f"       ✅ Input processed with {moment.confidence_level:.0%} confidence")
+                
+                # 2. MCP tools analyze
+                self._emit(buf, "\n  Phase 2: MCP Analysis")
+                self._emit(buf, "       ✅ Emotional analysis tool")
+                self._emit(buf, "       ✅ Logic reasoning tool")
+                self._emit(buf, "       ✅ Social context tool")
+                
+                # 3. CrewAI agents reason
+                self._emit(buf, "\n  Phase 3: Multi-Agent Reasoning")
+                self._emit(buf, "       ✅ Emotional agent analyzed fear factors")
+                self._emit(buf, "       ✅ Reasoning agent evaluated career change logic")
+                self._emit(buf, "       ✅ Social agent considered relationships impact")
+                self._emit(buf, "       ✅ Action agent created transition plan")
+                self._emit(buf, "       ✅ Coordinator synthesized response")
+                
+                # 4. Memory stores learning
+                self._emit(buf, "\n  Phase 4: Memory Integration")
+                self._emit(buf, "       ✅ Interaction stored in episodic memory")
+                self._emit(buf, "       ✅ Insights added to semantic knowledge")
+                self._emit(buf, "       ✅ Career transition process added to procedures")
+                
+                # 5. Response generation
+                self._emit(buf, "\n  Phase 5: Response Generation")
+                self._emit(buf, "       ✅ Human-like response created")
+                self._emit(buf, "       ✅ Tone matched emotional state")
+                self._emit(buf, "       ✅ Practical advice included")
+                self._emit(buf, "       ✅ Empathy demonstrated")
+                
+                response = """Your fear is completely valid - career changes are significant risks.
+    But I see something important here: you're willing to face that fear because 
+    something matters more. That's courage.
 
-Here's what I recommend:
-1. Evaluate: What specifically attracts you to this new career?
-2. Research: Interview people in the field
-3. Pilot: Can you try it part-time first?
-4. Plan: Build a 6-month transition strategy
-5. Support: Find mentors who've made similar changes
+    Here's what I recommend:
+    1. Evaluate: What specifically attracts you to this new career?
+    2. Research: Interview people in the field
+    3. Pilot: Can you try it part-time first?
+    4. Plan: Build a 6-month transition strategy
+    5. Support: Find mentors who've made similar changes
 
-The key insight: Successful career changers don't avoid risk - they manage it.
-What's the first step you'd like to explore?"""
-            
-            print(f"\n  Generated Response ({len(response)} characters):")
-            print(f"  \"{response[:100]}...\"")
-            
-            self.results["integration_tests"]["complete"] = {
-                "status": "PASS",
-                "input_processed": True,
-                "all_systems_engaged": True,
-                "response_generated": True
-            }
-            print(f"\n  Summary: Complete integration successful ✅")
-            
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            self.results["integration_tests"]["complete"] = {"status": "FAIL"}
+    The key insight: Successful career changers don't avoid risk - they manage it.
+    What's the first step you'd like to explore?"""
+                
+                self._emit(buf, f"\n  Generated Response ({len(response)} characters):")
+                self._emit(buf, f"  \"{response[:100]}...\"")
+                
+                self._record("integration_tests", "complete", {
+                    "status": "PASS",
+                    "input_processed": True,
+                    "all_systems_engaged": True,
+                    "response_generated": True
+                })
+                self._emit(buf, f"\n  Summary: Complete integration successful ✅")
+                
+            except ENGINE_ERRORS as e:
+                self._emit(buf, f"  ❌ Error: {e}")
+                self._record("integration_tests", "complete", {"status": "FAIL"})
+        finally:
+            self._flush(buf)
     
     def print_summary(self):
         """Print verification summary"""
@@ -462,26 +733,16 @@ What's the first step you'd like to explore?"""
         print("📊 VERIFICATION SUMMARY")
         print("="*70)
         
-        # Count passed tests
-        passed = 0
-        total = 0
+        for section in ("systems", "integration_tests"):
+            if section != "systems":
+                print()
+            for name, result in self.results[section].items():
+                status = result.get("status", "UNKNOWN")
+                print(f"{STATUS_SYMBOL.get(status, '❌')} {name.replace('_', ' ').title()}: {status}")
         
-        for system_name, result in self.results["systems"].items():
-            status = result.get("status", "UNKNOWN")
-            symbol = "✅" if status == "PASS" else "⚠️" if status == "PARTIAL" else "❌"
-            print(f"{symbol} {system_name.replace('_', ' ').title()}: {status}")
-            if status == "PASS":
-                passed += 1
-            total += 1
-        
-        print()
-        for test_name, result in self.results["integration_tests"].items():
-            status = result.get("status", "UNKNOWN")
-            symbol = "✅" if status == "PASS" else "⚠️" if status == "PARTIAL" else "❌"
-            print(f"{symbol} {test_name.replace('_', ' ').title()}: {status}")
-            if status == "PASS":
-                passed += 1
-            total += 1
+        # Counters are maintained by _record as each test finishes
+        passed = self._passed
+        total = self._total
         
         # Overall status
         print("\n" + "="*70)
@@ -502,21 +763,38 @@ What's the first step you'd like to explore?"""
         
         print("="*70)
         
-        # Save results to JSON
-        with open("verification_results.json", "w") as f:
-            json.dump(self.results, f, indent=2, default=str)
-        print("\n✅ Results saved to: verification_results.json")
+        self._save_results()
+        print(f"\n✅ Results saved to: {RESULTS_PATH}")
 
 
-async def main():
+async def main(force: bool = False):
     """Run complete verification suite"""
-    suite = OchukoVerificationSuite()
+    if hasattr(asyncio, "eager_task_factory"):
+        # Python 3.12+: gathered tests that finish without suspending
+        # complete immediately instead of waiting for a loop iteration
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    suite = OchukoVerificationSuite(force=force)
     await suite.run_complete_verification()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ochuko AI v5.0 system verification")
+    parser.add_argument(
+        "--force", action="store_true",
+        help=f"ignore cached results in {CACHE_DIR} and re-run every test"
+    )
+    args = parser.parse_args()
+    
+    try:
+        import uvloop
+        # Cheaper callback scheduling for every await in the suite
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass  # uvloop is unavailable on Windows; keep the default loop
+    
     try:
-        asyncio.run(main())
+        asyncio.run(main(force=args.force))
     except KeyboardInterrupt:
         print("\n\n⚠️  Verification interrupted by user")
         sys.exit(0)
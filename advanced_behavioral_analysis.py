@@ -5,52 +5,138 @@ Author: David Akpoviroro Oke (MrIridescent)
 Version: 2.0.0 Production-Grade
 """
 
+import asyncio
 import logging
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+import orjson
+import time
+from typing import Dict, List, Optional, Tuple, Any, Type, Union, ClassVar, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
+from types import MappingProxyType
+
+from batching import BatchScheduler
+from inference_backends import InferenceBackend
+from numba_compat import njit, prange
 
 logger = logging.getLogger(__name__)
 
+# COCO-17 keypoint indices used by the gait kernels. Keypoints are world
+# coordinates in metres: x = direction of travel, y = vertical, z = lateral.
+LEFT_SHOULDER, RIGHT_SHOULDER = 5, 6
+LEFT_HIP, RIGHT_HIP = 11, 12
+LEFT_ANKLE, RIGHT_ANKLE = 15, 16
+DEFAULT_VIDEO_FPS = 30.0
+BALANCE_SWAY_SCALE_M = 0.05  # Lateral sway (m) at which balance drops to ~37/100
+
+VOICE_PRINT_DIM = 256
+VOICE_PRINT_POOL_SIZE = 1024  # Voice prints drawn per RNG call
+VOICE_GALLERY_INITIAL_CAPACITY = 1024  # Enrolled prints; doubles when full
+VOICE_RERANK_TOP_K = 32  # int8 candidates re-scored with the float32 prints
+
+# Representative model inputs used to warm up inference backends
+WARMUP_VIDEO_SHAPE = (1, 224, 224, 3)  # (T, H, W, RGB) frames
+WARMUP_AUDIO_SAMPLES = 16000  # 1 s at 16 kHz
+
+# Structured record layout accepted by StressPatternDetector.detect_stress
+OBSERVATION_DTYPE = np.dtype([("type", "U32"), ("stress_indicator", "?")])
+
+# Record layouts for the MicroGestureAnalysis gesture buckets
+SELF_TOUCH_DTYPE = np.dtype([("behavior", "U16"), ("frequency", "u2"), ("duration_ms", "u2")])
+ILLUSTRATOR_DTYPE = np.dtype([("gesture", "U16"), ("emphasis", "f4")])
+ADAPTOR_DTYPE = np.dtype([("behavior", "U16"), ("anxiety_indicator", "?")])
+REGULATOR_DTYPE = np.dtype([("gesture", "U16"), ("frequency", "u2")])
+EMBLEM_DTYPE = np.dtype([("gesture", "U16"), ("meaning", "U16")])
+LEAKAGE_DTYPE = np.dtype([("emotion", "U16"), ("duration_ms", "u2"), ("face_region", "U8")])
+DECEPTION_CLUSTER_DTYPE = np.dtype([("cluster_type", "U24"), ("intensity", "f4"), ("confidence", "f4")])
+
+# Coalescing window and size cap for batched behavioral profiling
+PROFILE_BATCH_WAIT_MS = 5.0
+PROFILE_MAX_BATCH = 16
+
+
+class GaitCharacteristic(IntEnum):
+    """Gait characteristics for identification and health assessment (feature vector index)"""
+    STRIDE_LENGTH = 0
+    CADENCE = 1
+    VELOCITY = 2
+    ASYMMETRY = 3
+    BALANCE = 4
+    POSTURE_ALIGNMENT = 5
+    LEG_CLEARANCE = 6
+    KNEE_FLEXION = 7
+    HIP_ROTATION = 8
+    GROUND_CONTACT = 9
+
+
+class VoiceBiometric(IntEnum):
+    """Voice biometric features for identification and state analysis (feature vector index)"""
+    FUNDAMENTAL_FREQUENCY = 0
+    PITCH_VARIATION = 1
+    FORMANT_FREQUENCIES = 2
+    VOICE_QUALITY = 3
+    SPEECH_RATE = 4
+    AMPLITUDE_VARIATION = 5
+    SPECTRAL_CHARACTERISTICS = 6
+    VOICE_STRESS = 7
+    EMOTIONAL_PROSODY = 8
+    ACCENT_PATTERNS = 9
+
+
+class GestureLabel(IntEnum):
+    """Micro-gesture vocabulary (index into GESTURE_NAMES)"""
+    HAND_TO_FACE = 0
+    CROSSED_ARMS = 1
+    FORWARD_LEAN = 2
+    EYE_CONTACT_REDUCED = 3
+    JAW_TENSION = 4
+
+
+GESTURE_NAMES: Tuple[str, ...] = (
+    "Hand to face",
+    "Crossed arms",
+    "Forward lean",
+    "Eye contact reduced",
+    "Jaw tension"
+)
+
+N_GAIT_FEATURES = len(GaitCharacteristic)
+N_VOICE_FEATURES = len(VoiceBiometric)
+
+
+def feature_vector(n_features: int, values: Dict[IntEnum, float]) -> np.ndarray:
+    """Pack feature values into a float32 vector; unmeasured features are NaN"""
+    vector = np.full(n_features, np.nan, dtype=np.float32)
+    for feature, value in values.items():
+        vector[feature] = value
+    return vector
+
 
-class GaitCharacteristic(Enum):
-    """Gait characteristics for identification and health assessment"""
-    STRIDE_LENGTH = "stride_length"
-    CADENCE = "cadence"
-    VELOCITY = "velocity"
-    ASYMMETRY = "asymmetry"
-    BALANCE = "balance"
-    POSTURE_ALIGNMENT = "posture_alignment"
-    LEG_CLEARANCE = "leg_clearance"
-    KNEE_FLEXION = "knee_flexion"
-    HIP_ROTATION = "hip_rotation"
-    GROUND_CONTACT = "ground_contact"
-
-
-class VoiceBiometric(Enum):
-    """Voice biometric features for identification and state analysis"""
-    FUNDAMENTAL_FREQUENCY = "fundamental_frequency"
-    PITCH_VARIATION = "pitch_variation"
-    FORMANT_FREQUENCIES = "formant_frequencies"
-    VOICE_QUALITY = "voice_quality"
-    SPEECH_RATE = "speech_rate"
-    AMPLITUDE_VARIATION = "amplitude_variation"
-    SPECTRAL_CHARACTERISTICS = "spectral_characteristics"
-    VOICE_STRESS = "voice_stress"
-    EMOTIONAL_PROSODY = "emotional_prosody"
-    ACCENT_PATTERNS = "accent_patterns"
-
-
-@dataclass
+def quantize_voice_print(voice_print: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Symmetric int8 quantization: returns (codes, scale) with voice_print ~= codes * scale"""
+    scale = max(float(np.abs(voice_print).max()), 1e-12) / 127.0
+    codes = np.clip(np.rint(voice_print / scale), -127, 127).astype(np.int8)
+    return codes, scale
+
+
+def features_to_dict(vector: np.ndarray, features: Type[IntEnum]) -> Dict[str, float]:
+    """Unpack a feature vector into the legacy {"feature_name": value} form, skipping NaN"""
+    return {
+        feature.name.lower(): float(vector[feature])
+        for feature in features
+        if not np.isnan(vector[feature])
+    }
+
+
+@dataclass(slots=True, frozen=True)
 class GaitAnalysis:
     """Complete gait analysis for identification and health"""
     subject_id: str
     analysis_id: str
     timestamp: datetime
     
-    gait_characteristics: Dict[GaitCharacteristic, float]
+    gait_characteristics: np.ndarray  # float32 (N_GAIT_FEATURES,), indexed by GaitCharacteristic
     gait_symmetry: float  # 0-100 (100 = perfect symmetry)
     balance_assessment: float  # 0-100
     movement_fluidity: float  # 0-100
@@ -67,18 +153,18 @@ class GaitAnalysis:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VoiceBiometricProfile:
     """Complete voice biometric profile"""
     subject_id: str
     profile_date: datetime
     
-    biometric_features: Dict[VoiceBiometric, float]
-    voice_print: List[float]  # Unique voice signature
+    biometric_features: np.ndarray  # float32 (N_VOICE_FEATURES,), indexed by VoiceBiometric
+    voice_print: np.ndarray  # Unique voice signature, float32 (VOICE_PRINT_DIM,)
     identification_confidence: float  # 0-100 for person identification
     
     emotional_state: str
-    stress_indicators: Dict[str, float]
+    stress_indicators: np.ndarray  # float32, parallel to stress_indicator_names
     deception_likelihood: float
     credibility_score: float
     
@@ -86,105 +172,274 @@ class VoiceBiometricProfile:
     cognitive_load: float  # 0-100 (how much mental effort)
     truthfulness_score: float  # 0-100
     confidence: float
+    
+    stress_indicator_names: ClassVar[Tuple[str, ...]] = (
+        "vocal_tension",
+        "speech_rate_increase",
+        "pitch_elevation"
+    )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MicroGestureAnalysis:
     """Detailed micro-gesture analysis"""
     timestamp: datetime
-    detected_gestures: List[str]
+    detected_gestures: np.ndarray  # uint8 GestureLabel values
     
-    self_touching_behaviors: List[Dict]  # Self-soothing indicators
-    illustrator_gestures: List[Dict]  # Emphasis gestures
-    adaptor_behaviors: List[Dict]  # Nervous behaviors
-    regulator_gestures: List[Dict]  # Turn-taking signals
+    self_touching_behaviors: np.ndarray  # SELF_TOUCH_DTYPE - self-soothing indicators
+    illustrator_gestures: np.ndarray  # ILLUSTRATOR_DTYPE - emphasis gestures
+    adaptor_behaviors: np.ndarray  # ADAPTOR_DTYPE - nervous behaviors
+    regulator_gestures: np.ndarray  # REGULATOR_DTYPE - turn-taking signals
     
-    emblematic_gestures: List[Dict]  # Symbolic gestures
-    emotional_leakage: List[Dict]  # True emotion indicators
+    emblematic_gestures: np.ndarray  # EMBLEM_DTYPE - symbolic gestures
+    emotional_leakage: np.ndarray  # LEAKAGE_DTYPE - true emotion indicators
     
-    deception_gesture_clusters: List[Dict]
+    deception_gesture_clusters: np.ndarray  # DECEPTION_CLUSTER_DTYPE
     confidence_indicators: List[str]
     uncertainty_indicators: List[str]
     
     overall_confidence: float  # In gesture interpretation
 
 
+def _nan_column_mean(data: np.ndarray) -> np.ndarray:
+    """Column means over non-NaN entries; columns with no measurements stay NaN"""
+    measured = ~np.isnan(data)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(measured, data, 0.0).sum(axis=0) / measured.sum(axis=0)
+
+
+class GaitCohort:
+    """Cohort-level gait statistics computed column-wise over many GaitAnalysis records"""
+    
+    def __init__(self, analyses: List[GaitAnalysis]):
+        self.analyses = analyses
+        self._data: Optional[np.ndarray] = None
+    
+    @property
+    def data(self) -> np.ndarray:
+        """float32 (N, N_GAIT_FEATURES) matrix, stacked on first access"""
+        if self._data is None:
+            self._data = np.vstack(
+                [gait.gait_characteristics for gait in self.analyses]
+            ) if self.analyses else np.empty((0, N_GAIT_FEATURES), dtype=np.float32)
+        return self._data
+    
+    def mean_features(self) -> np.ndarray:
+        """Per-characteristic cohort mean, ignoring unmeasured (NaN) entries"""
+        return _nan_column_mean(self.data)
+    
+    def mean_cadence(self) -> float:
+        return float(np.nanmean(self.data[:, GaitCharacteristic.CADENCE]))
+    
+    def symmetry_percentiles(self, q: Tuple[float, ...] = (5, 50, 95)) -> np.ndarray:
+        symmetry = np.fromiter(
+            (gait.gait_symmetry for gait in self.analyses), dtype=np.float32, count=len(self.analyses)
+        )
+        return np.percentile(symmetry, q)
+
+
+class VoiceCohort:
+    """Cohort-level voice statistics computed column-wise over many VoiceBiometricProfile records"""
+    
+    def __init__(self, profiles: List[VoiceBiometricProfile]):
+        self.profiles = profiles
+        self._data: Optional[np.ndarray] = None
+    
+    @property
+    def data(self) -> np.ndarray:
+        """float32 (N, N_VOICE_FEATURES) matrix, stacked on first access"""
+        if self._data is None:
+            self._data = np.vstack(
+                [profile.biometric_features for profile in self.profiles]
+            ) if self.profiles else np.empty((0, N_VOICE_FEATURES), dtype=np.float32)
+        return self._data
+    
+    def mean_features(self) -> np.ndarray:
+        """Per-feature cohort mean, ignoring unmeasured (NaN) entries"""
+        return _nan_column_mean(self.data)
+    
+    def mean_fundamental_frequency(self) -> float:
+        return float(np.nanmean(self.data[:, VoiceBiometric.FUNDAMENTAL_FREQUENCY]))
+    
+    def stress_percentiles(self, q: Tuple[float, ...] = (5, 50, 95)) -> np.ndarray:
+        return np.nanpercentile(self.data[:, VoiceBiometric.VOICE_STRESS], q)
+
+
+_STATIC_SUMMARY: Mapping[str, Any] = MappingProxyType({
+    "identification_confidence": 0.992,
+    "deception_confidence": 0.87,
+    "behavior_prediction_confidence": 0.72,
+    "overall_assessment_confidence": 0.88,
+    "key_findings": (
+        "Subject identified with high confidence",
+        "Stress indicators present",
+        "Behavioral patterns analyzed"
+    ),
+    "anomalies": (),
+    "recommendations": ()
+})
+_STATIC_SUMMARY_JSON = orjson.Fragment(orjson.dumps(dict(_STATIC_SUMMARY)))
+
+
+def dumps_profile(profile: Dict[str, Any]) -> bytes:
+    """
+    Serialize a behavioral profile to JSON bytes. ndarray values are written
+    natively and the unchanged static summary is spliced in pre-encoded.
+    """
+    if profile.get("behavioral_summary") == _STATIC_SUMMARY:
+        profile = {**profile, "behavioral_summary": _STATIC_SUMMARY_JSON}
+    return orjson.dumps(profile, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+ENGINE_NAME = "Advanced Behavioral Analysis Engine"
+
+# Template for profiles requested without any video, audio or observations
+_EMPTY_PROFILE: Dict[str, Any] = {
+    "subject_id": None,
+    "analysis_timestamp": None,
+    "profile_completeness": 0.95,
+    "behavioral_summary": None
+}
+
+
 class AdvancedBehavioralAnalysisEngine:
     """Advanced behavioral analysis exceeding forensic standards"""
     
-    def __init__(self):
-        self.gait_analyzer = GaitAnalyzer()
-        self.voice_biometric_system = VoiceBiometricSystem()
+    def __init__(
+        self,
+        pose_backend: Optional[InferenceBackend] = None,
+        voice_backend: Optional[InferenceBackend] = None
+    ):
+        self.gait_analyzer = GaitAnalyzer(pose_backend)
+        self.voice_biometric_system = VoiceBiometricSystem(voice_backend)
         self.micro_gesture_analyzer = MicroGestureAnalyzer()
         self.stress_pattern_detector = StressPatternDetector()
         self.movement_quality_assessor = MovementQualityAssessor()
         self.is_ready = False
+        
+        # Concurrent single-subject requests are coalesced into profile batches
+        self._profile_batcher = BatchScheduler(
+            self.comprehensive_behavioral_profile_batch,
+            max_batch=PROFILE_MAX_BATCH, max_wait_ms=PROFILE_BATCH_WAIT_MS
+        )
     
     async def initialize(self):
         """Initialize all behavioral analysis subsystems"""
-        logger.info("Initializing Advanced Behavioral Analysis Engine...")
+        logger.info("Initializing %s...", ENGINE_NAME)
+        started = time.perf_counter()
+        self.gait_analyzer.warmup()
+        self.voice_biometric_system.warmup()
+        logger.info("Behavioral models warmed up in %.1f ms", (time.perf_counter() - started) * 1000)
         self.is_ready = True
-        logger.info("✅ Advanced Behavioral Analysis Engine ready")
+        logger.info("\u2705 %s ready", ENGINE_NAME)
     
     async def comprehensive_behavioral_profile(
         self,
         subject_id: str,
         video_feed: Optional[Any] = None,
         audio_stream: Optional[Any] = None,
-        observations: Optional[List[Dict]] = None
+        observations: Optional[Union[List[Dict], np.ndarray]] = None
     ) -> Dict[str, Any]:
         """
         Create comprehensive behavioral profile from all data sources.
         Identifies subject with 99.2%+ accuracy, detects deception at 87%+, 
         predicts behavior 72%+ accurately.
+        
+        Concurrent calls are profiled together by comprehensive_behavioral_profile_batch
+        (a lone call runs at once; see batching.BatchScheduler).
         """
+        if video_feed is None and audio_stream is None and (observations is None or not len(observations)):
+            # Nothing to analyze: skip the batching queue entirely
+            return {
+                **_EMPTY_PROFILE,
+                "subject_id": subject_id,
+                "analysis_timestamp": datetime.now().isoformat(),
+                "behavioral_summary": dict(_STATIC_SUMMARY)
+            }
         
-        profile = {
+        return await self._profile_batcher.submit({
             "subject_id": subject_id,
-            "analysis_timestamp": datetime.now().isoformat(),
-            "profile_completeness": 0.95
-        }
-        
-        if video_feed:
-            gait = await self.gait_analyzer.analyze_gait(video_feed, subject_id)
-            profile["gait_analysis"] = self._serialize_gait(gait)
-            
-            gestures = await self.micro_gesture_analyzer.analyze_all_gestures(
-                video_feed, subject_id
-            )
-            profile["micro_gesture_analysis"] = self._serialize_gestures(gestures)
+            "video_feed": video_feed,
+            "audio_stream": audio_stream,
+            "observations": observations
+        })
+    
+    async def comprehensive_behavioral_profile_batch(
+        self,
+        subjects: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Profile many subjects at once. Each subject is a dict with "subject_id"
+        and optional "video_feed", "audio_stream" and "observations".
+        """
+        # One timestamp per batch, shared by every subsystem result
+        now = datetime.now()
+        now_iso = now.isoformat()
         
-        if audio_stream:
-            voice_profile = await self.voice_biometric_system.analyze_voice(
-                audio_stream, subject_id
-            )
-            profile["voice_biometric_profile"] = self._serialize_voice(voice_profile)
+        with_video = [i for i, subject in enumerate(subjects) if subject.get("video_feed") is not None]
+        with_audio = [i for i, subject in enumerate(subjects) if subject.get("audio_stream") is not None]
+        with_observations = [
+            i for i, subject in enumerate(subjects)
+            if subject.get("observations") is not None and len(subject["observations"])
+        ]
         
-        if observations:
-            stress_patterns = await self.stress_pattern_detector.detect_stress(
-                observations, subject_id
-            )
-            profile["stress_patterns"] = stress_patterns
+        # Subsystems are independent of each other, so their work overlaps
+        gaits, gestures, voice_profiles, stress_patterns = await asyncio.gather(
+            self.gait_analyzer.analyze_gait_batch(
+                [subjects[i]["video_feed"] for i in with_video],
+                [subjects[i]["subject_id"] for i in with_video],
+                _now=now
+            ),
+            asyncio.gather(*(
+                self.micro_gesture_analyzer.analyze_all_gestures(
+                    subjects[i]["video_feed"], subjects[i]["subject_id"], _now=now
+                )
+                for i in with_video
+            )),
+            asyncio.gather(*(
+                self.voice_biometric_system.analyze_voice(
+                    subjects[i]["audio_stream"], subjects[i]["subject_id"], _now=now
+                )
+                for i in with_audio
+            )),
+            asyncio.gather(*(
+                self.stress_pattern_detector.detect_stress(
+                    subjects[i]["observations"], subjects[i]["subject_id"]
+                )
+                for i in with_observations
+            ))
+        )
+        gait_by_index = dict(zip(with_video, gaits))
+        gestures_by_index = dict(zip(with_video, gestures))
+        voice_by_index = dict(zip(with_audio, voice_profiles))
+        stress_by_index = dict(zip(with_observations, stress_patterns))
         
-        profile["behavioral_summary"] = await self._synthesize_profile(profile)
+        profiles = []
+        for index, subject in enumerate(subjects):
+            profile = {
+                "subject_id": subject["subject_id"],
+                "analysis_timestamp": now_iso,
+                "profile_completeness": 0.95
+            }
+            
+            if index in gait_by_index:
+                profile["gait_analysis"] = self._serialize_gait(gait_by_index[index])
+                profile["micro_gesture_analysis"] = self._serialize_gestures(gestures_by_index[index])
+            
+            if index in voice_by_index:
+                profile["voice_biometric_profile"] = self._serialize_voice(voice_by_index[index])
+            
+            if index in stress_by_index:
+                profile["stress_patterns"] = stress_by_index[index]
+            
+            profile["behavioral_summary"] = self._synthesize_profile(profile)
+            profiles.append(profile)
         
-        return profile
+        return profiles
     
-    async def _synthesize_profile(self, profile: Dict) -> Dict[str, Any]:
+    def _synthesize_profile(self, profile: Dict) -> Dict[str, Any]:
         """Synthesize all behavioral data into summary"""
-        return {
-            "identification_confidence": 0.992,
-            "deception_confidence": 0.87,
-            "behavior_prediction_confidence": 0.72,
-            "overall_assessment_confidence": 0.88,
-            "key_findings": [
-                "Subject identified with high confidence",
-                "Stress indicators present",
-                "Behavioral patterns analyzed"
-            ],
-            "anomalies": [],
-            "recommendations": []
-        }
+        return dict(_STATIC_SUMMARY)
     
     def _serialize_gait(self, gait: GaitAnalysis) -> Dict:
         """Serialize gait analysis for JSON"""
@@ -199,8 +454,8 @@ class AdvancedBehavioralAnalysisEngine:
     def _serialize_gestures(self, gestures: MicroGestureAnalysis) -> Dict:
         """Serialize gesture analysis for JSON"""
         return {
-            "detected_gestures": gestures.detected_gestures,
-            "deception_indicators": len(gestures.deception_gesture_clusters),
+            "detected_gestures": [GESTURE_NAMES[label] for label in gestures.detected_gestures],
+            "deception_indicators": gestures.deception_gesture_clusters.shape[0],
             "confidence_indicators": gestures.confidence_indicators,
             "uncertainty_indicators": gestures.uncertainty_indicators,
             "overall_confidence": gestures.overall_confidence
@@ -211,37 +466,231 @@ class AdvancedBehavioralAnalysisEngine:
         return {
             "identification_confidence": voice.identification_confidence,
             "emotional_state": voice.emotional_state,
-            "stress_level": np.mean(list(voice.stress_indicators.values())) if voice.stress_indicators else 0.5,
+            "stress_level": float(voice.stress_indicators.mean()) if voice.stress_indicators.size else 0.5,
+            "stress_indicators": dict(zip(
+                voice.stress_indicator_names, voice.stress_indicators.tolist()
+            )),
             "deception_likelihood": voice.deception_likelihood,
             "truthfulness_score": voice.truthfulness_score,
             "confidence": voice.confidence
         }
 
 
+@njit(cache=True, parallel=True)
+def _int8_scores(gallery, query, out):
+    """int32 dot products of int8 gallery rows (N, D) with an int8 query (D,)"""
+    for i in prange(gallery.shape[0]):
+        acc = np.int32(0)
+        for j in range(gallery.shape[1]):
+            acc += np.int32(gallery[i, j]) * np.int32(query[j])
+        out[i] = acc
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _stride_cadence(kp, fps):
+    """Stride length (m), cadence (steps/min) and velocity (m/s) from keypoints (T, K, 3)"""
+    n_frames = kp.shape[0]
+    steps = 0
+    # Each swing-phase apex (ankle height velocity crossing from + to -) is one step
+    for t in prange(1, n_frames - 1):
+        for ankle in (LEFT_ANKLE, RIGHT_ANKLE):
+            rising = kp[t, ankle, 1] - kp[t - 1, ankle, 1]
+            falling = kp[t + 1, ankle, 1] - kp[t, ankle, 1]
+            if rising > 0.0 and falling <= 0.0:
+                steps += 1
+    
+    duration = (n_frames - 1) / fps
+    start = 0.5 * (kp[0, LEFT_HIP, 0] + kp[0, RIGHT_HIP, 0])
+    end = 0.5 * (kp[n_frames - 1, LEFT_HIP, 0] + kp[n_frames - 1, RIGHT_HIP, 0])
+    velocity = abs(end - start) / duration
+    cadence = steps * 60.0 / duration
+    # A stride is two steps
+    stride_length = 2.0 * velocity * 60.0 / cadence if cadence > 0.0 else 0.0
+    return stride_length, cadence, velocity
+
+
+@njit(cache=True, fastmath=True)
+def _symmetry(left, right):
+    """Asymmetry (%) and symmetry (0-100) of left vs right ankle height excursion"""
+    left_range = left.max() - left.min()
+    right_range = right.max() - right.min()
+    mean_range = 0.5 * (left_range + right_range)
+    if mean_range <= 0.0:
+        return 0.0, 100.0
+    asymmetry = abs(left_range - right_range) / mean_range * 100.0
+    return asymmetry, max(0.0, 100.0 - asymmetry)
+
+
+@njit(cache=True, fastmath=True)
+def _balance(com_xy):
+    """Balance (0-100) from lateral sway of the horizontal centre-of-mass path (T, 2)"""
+    n_frames = com_xy.shape[0]
+    dx = com_xy[n_frames - 1, 0] - com_xy[0, 0]
+    dy = com_xy[n_frames - 1, 1] - com_xy[0, 1]
+    length = np.sqrt(dx * dx + dy * dy)
+    sway = 0.0
+    for t in range(n_frames):
+        rx = com_xy[t, 0] - com_xy[0, 0]
+        ry = com_xy[t, 1] - com_xy[0, 1]
+        # Perpendicular distance from the straight line between start and end
+        dist = abs(rx * dy - ry * dx) / length if length > 0.0 else np.sqrt(rx * rx + ry * ry)
+        sway += dist * dist
+    sway = np.sqrt(sway / n_frames)
+    return 100.0 * np.exp(-sway / BALANCE_SWAY_SCALE_M)
+
+
+@njit(cache=True, fastmath=True)
+def _posture_alignment(kp):
+    """Posture alignment (0-100): mean cosine of trunk angle to vertical"""
+    n_frames = kp.shape[0]
+    total = 0.0
+    for t in range(n_frames):
+        tx = 0.5 * (kp[t, LEFT_SHOULDER, 0] + kp[t, RIGHT_SHOULDER, 0] - kp[t, LEFT_HIP, 0] - kp[t, RIGHT_HIP, 0])
+        ty = 0.5 * (kp[t, LEFT_SHOULDER, 1] + kp[t, RIGHT_SHOULDER, 1] - kp[t, LEFT_HIP, 1] - kp[t, RIGHT_HIP, 1])
+        tz = 0.5 * (kp[t, LEFT_SHOULDER, 2] + kp[t, RIGHT_SHOULDER, 2] - kp[t, LEFT_HIP, 2] - kp[t, RIGHT_HIP, 2])
+        norm = np.sqrt(tx * tx + ty * ty + tz * tz)
+        if norm > 0.0:
+            total += max(0.0, ty / norm)
+    return 100.0 * total / n_frames
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _gait_features_batch(kp_batch, fps, out):
+    """Fill out[b] with the gait features of subject b from keypoints (B, T, K, 3)"""
+    for b in prange(kp_batch.shape[0]):
+        kp = kp_batch[b]
+        stride_length, cadence, velocity = _stride_cadence(kp, fps[b])
+        asymmetry, _ = _symmetry(kp[:, LEFT_ANKLE, 1], kp[:, RIGHT_ANKLE, 1])
+        com_xy = np.empty((kp.shape[0], 2), dtype=np.float32)
+        com_xy[:, 0] = 0.5 * (kp[:, LEFT_HIP, 0] + kp[:, RIGHT_HIP, 0])
+        com_xy[:, 1] = 0.5 * (kp[:, LEFT_HIP, 2] + kp[:, RIGHT_HIP, 2])
+        out[b, GaitCharacteristic.STRIDE_LENGTH] = stride_length
+        out[b, GaitCharacteristic.CADENCE] = cadence
+        out[b, GaitCharacteristic.VELOCITY] = velocity
+        out[b, GaitCharacteristic.ASYMMETRY] = asymmetry
+        out[b, GaitCharacteristic.BALANCE] = _balance(com_xy)
+        out[b, GaitCharacteristic.POSTURE_ALIGNMENT] = _posture_alignment(kp)
+
+
 class GaitAnalyzer:
     """Analyze walking patterns for identification and health assessment"""
     
+    def __init__(self, pose_backend: Optional[InferenceBackend] = None):
+        # 3D pose model mapping (T, H, W, 3) frames to (T, K, 3) keypoints
+        self.pose_backend = pose_backend
+    
+    @staticmethod
+    def extract_features_batch(keypoints: np.ndarray, fps: np.ndarray) -> np.ndarray:
+        """
+        Compute gait characteristics for B subjects from (B, T, K, 3) keypoints.
+        Returns a float32 (B, N_GAIT_FEATURES) matrix indexed by GaitCharacteristic.
+        """
+        kp = np.ascontiguousarray(keypoints, dtype=np.float32)
+        out = np.full((kp.shape[0], N_GAIT_FEATURES), np.nan, dtype=np.float32)
+        _gait_features_batch(kp, np.ascontiguousarray(fps, dtype=np.float64), out)
+        return out
+    
+    def extract_features(self, keypoints: np.ndarray, fps: float = DEFAULT_VIDEO_FPS) -> np.ndarray:
+        """Gait characteristics of one (T, K, 3) keypoint series as a (N_GAIT_FEATURES,) vector"""
+        return self.extract_features_batch(keypoints[np.newaxis], np.array([fps]))[0]
+    
+    def _keypoints_from_feed(self, video_feed: Any) -> Tuple[Optional[np.ndarray], float]:
+        """Extract a (T, K, 3) keypoint series and frame rate from a video feed"""
+        fps = DEFAULT_VIDEO_FPS
+        if isinstance(video_feed, dict):
+            try:
+                fps = float(video_feed.get("fps", fps))
+            except (TypeError, ValueError):
+                return None, DEFAULT_VIDEO_FPS
+            if not 0.0 < fps < float("inf"):
+                # Stride timing divides by fps: without a usable rate there is no gait to measure
+                return None, DEFAULT_VIDEO_FPS
+            frames = video_feed.get("frames")
+            video_feed = video_feed.get("keypoints")
+            if video_feed is None and frames is not None and self.pose_backend is not None:
+                video_feed = self.pose_backend.infer(np.asarray(frames, dtype=np.float32))
+        if video_feed is None:
+            return None, fps
+        try:
+            keypoints = np.asarray(video_feed, dtype=np.float32)
+        except (TypeError, ValueError):
+            return None, fps
+        if keypoints.ndim != 3 or keypoints.shape[0] < 3 or keypoints.shape[1] <= RIGHT_ANKLE or keypoints.shape[2] != 3:
+            return None, fps
+        return keypoints, fps
+    
+    def warmup(self):
+        """Compile the gait kernels and load the pose model ahead of the first request"""
+        self.extract_features(np.zeros((3, RIGHT_ANKLE + 1, 3), dtype=np.float32))
+        if self.pose_backend is not None:
+            self.pose_backend.infer(np.zeros(WARMUP_VIDEO_SHAPE, dtype=np.float32))
+    
     async def analyze_gait(
         self,
         video_feed: Any,
-        subject_id: str
+        subject_id: str,
+        _now: Optional[datetime] = None
     ) -> GaitAnalysis:
         """Complete gait analysis"""
+        return (await self.analyze_gait_batch([video_feed], [subject_id], _now=_now))[0]
+    
+    async def analyze_gait_batch(
+        self,
+        video_feeds: List[Any],
+        subject_ids: List[str],
+        _now: Optional[datetime] = None
+    ) -> List[GaitAnalysis]:
+        """Gait analysis for many subjects, one kernel launch per keypoint shape"""
+        now = _now or datetime.now()
+        parsed = [self._keypoints_from_feed(feed) for feed in video_feeds]
         
-        gait = GaitAnalysis(
-            subject_id=subject_id,
-            analysis_id=f"gait_{datetime.now().timestamp()}",
-            timestamp=datetime.now(),
-            gait_characteristics={
+        features: List[Optional[np.ndarray]] = [None] * len(parsed)
+        by_shape: Dict[Tuple[int, ...], List[int]] = {}
+        for index, (keypoints, _) in enumerate(parsed):
+            if keypoints is not None:
+                by_shape.setdefault(keypoints.shape, []).append(index)
+        for indices in by_shape.values():
+            batch = self.extract_features_batch(
+                np.stack([parsed[i][0] for i in indices]),
+                np.array([parsed[i][1] for i in indices])
+            )
+            for row, index in enumerate(indices):
+                features[index] = batch[row]
+        
+        return [
+            self._build_analysis(subject_id, gait_characteristics, now)
+            for subject_id, gait_characteristics in zip(subject_ids, features)
+        ]
+    
+    def _build_analysis(
+        self,
+        subject_id: str,
+        gait_characteristics: Optional[np.ndarray],
+        now: datetime
+    ) -> GaitAnalysis:
+        if gait_characteristics is not None:
+            gait_symmetry = max(0.0, 100.0 - float(gait_characteristics[GaitCharacteristic.ASYMMETRY]))
+            balance = float(gait_characteristics[GaitCharacteristic.BALANCE])
+        else:
+            # No pose keypoints in the feed: fall back to reference values
+            gait_characteristics = feature_vector(N_GAIT_FEATURES, {
                 GaitCharacteristic.STRIDE_LENGTH: 1.42,
                 GaitCharacteristic.CADENCE: 110.5,
                 GaitCharacteristic.VELOCITY: 1.48,
                 GaitCharacteristic.ASYMMETRY: 2.3,
                 GaitCharacteristic.BALANCE: 94.5,
                 GaitCharacteristic.POSTURE_ALIGNMENT: 96.2
-            },
-            gait_symmetry=97.8,
-            balance_assessment=94.5,
+            })
+            gait_symmetry = 97.8
+            balance = 94.5
+        
+        gait = GaitAnalysis(
+            subject_id=subject_id,
+            analysis_id=f"gait_{time.monotonic_ns()}",
+            timestamp=now,
+            gait_characteristics=gait_characteristics,
+            gait_symmetry=gait_symmetry,
+            balance_assessment=balance,
             movement_fluidity=92.3,
             health_indicators={
                 "joint_health": "good",
@@ -263,31 +712,101 @@ class GaitAnalyzer:
 class VoiceBiometricSystem:
     """Voice biometric identification and analysis"""
     
+    _rng = np.random.default_rng()
+    
+    def __init__(self, embedding_backend: Optional[InferenceBackend] = None):
+        # Speaker embedding model mapping (1, samples) audio to (1, VOICE_PRINT_DIM)
+        self.embedding_backend = embedding_backend
+        self._voice_print_pool = self._new_voice_print_pool()
+        self._voice_print_cursor = 0
+        
+        # Enrolled, L2-normalized voice prints; rows [0, _gallery_size) are live.
+        # The int8 copy (4x less memory traffic) ranks candidates, float32 re-ranks them.
+        self._gallery = np.empty((VOICE_GALLERY_INITIAL_CAPACITY, VOICE_PRINT_DIM), dtype=np.float32)
+        self._gallery_int8 = np.empty((VOICE_GALLERY_INITIAL_CAPACITY, VOICE_PRINT_DIM), dtype=np.int8)
+        self._gallery_scale = np.empty(VOICE_GALLERY_INITIAL_CAPACITY, dtype=np.float32)
+        self._gallery_ids: List[str] = []
+        self._gallery_size = 0
+    
+    def warmup(self):
+        """Compile the gallery kernel and load the embedding model ahead of the first request"""
+        _int8_scores(
+            np.zeros((1, VOICE_PRINT_DIM), dtype=np.int8),
+            np.zeros(VOICE_PRINT_DIM, dtype=np.int8),
+            np.empty(1, dtype=np.int32)
+        )
+        if self.embedding_backend is not None:
+            self.embedding_backend.infer(np.zeros((1, WARMUP_AUDIO_SAMPLES), dtype=np.float32))
+    
+    def enroll(self, subject_id: str, voice_print: np.ndarray):
+        """Add a subject's voice print to the identification gallery"""
+        if self._gallery_size == self._gallery.shape[0]:
+            self._gallery = self._grow(self._gallery)
+            self._gallery_int8 = self._grow(self._gallery_int8)
+            self._gallery_scale = self._grow(self._gallery_scale)
+        row = self._gallery[self._gallery_size]
+        row[:] = voice_print
+        row /= max(float(np.linalg.norm(row)), 1e-12)
+        self._gallery_int8[self._gallery_size], self._gallery_scale[self._gallery_size] = \
+            quantize_voice_print(row)
+        self._gallery_ids.append(subject_id)
+        self._gallery_size += 1
+    
+    def identify(self, voice_print: np.ndarray) -> Tuple[Optional[str], float]:
+        """Best gallery match and its cosine similarity (None, 0.0 if nothing is enrolled)"""
+        if self._gallery_size == 0:
+            return None, 0.0
+        query = np.asarray(voice_print, dtype=np.float32)
+        n = self._gallery_size
+        if n <= VOICE_RERANK_TOP_K:
+            candidates = np.arange(n)
+        else:
+            # Coarse pass on int8 codes; the query scale is shared so it drops out of the ranking
+            query_int8, _ = quantize_voice_print(query)
+            coarse = np.empty(n, dtype=np.int32)
+            _int8_scores(self._gallery_int8[:n], query_int8, coarse)
+            coarse = coarse * self._gallery_scale[:n]
+            candidates = np.argpartition(coarse, -VOICE_RERANK_TOP_K)[-VOICE_RERANK_TOP_K:]
+        scores = self._gallery[candidates] @ query
+        best = int(scores.argmax())
+        return (
+            self._gallery_ids[int(candidates[best])],
+            float(scores[best]) / max(float(np.linalg.norm(query)), 1e-12)
+        )
+    
+    def _grow(self, buffer: np.ndarray) -> np.ndarray:
+        grown = np.empty((2 * buffer.shape[0],) + buffer.shape[1:], dtype=buffer.dtype)
+        grown[:self._gallery_size] = buffer[:self._gallery_size]
+        return grown
+    
     async def analyze_voice(
         self,
         audio_stream: Any,
-        subject_id: str
+        subject_id: str,
+        _now: Optional[datetime] = None
     ) -> VoiceBiometricProfile:
         """Complete voice biometric analysis"""
         
+        voice_print = self._voice_print(audio_stream)
+        identification_confidence = 97.3
+        if self._gallery_size:
+            _, similarity = self.identify(voice_print)
+            identification_confidence = max(0.0, similarity) * 100
+        
         profile = VoiceBiometricProfile(
             subject_id=subject_id,
-            profile_date=datetime.now(),
-            biometric_features={
+            profile_date=_now or datetime.now(),
+            biometric_features=feature_vector(N_VOICE_FEATURES, {
                 VoiceBiometric.FUNDAMENTAL_FREQUENCY: 135.5,
                 VoiceBiometric.PITCH_VARIATION: 45.2,
                 VoiceBiometric.VOICE_QUALITY: 8.7,
                 VoiceBiometric.SPEECH_RATE: 150.5,
                 VoiceBiometric.VOICE_STRESS: 25.3
-            },
-            voice_print=self._generate_voice_print(),
-            identification_confidence=97.3,
+            }),
+            voice_print=voice_print,
+            identification_confidence=identification_confidence,
             emotional_state="neutral_with_slight_tension",
-            stress_indicators={
-                "vocal_tension": 0.45,
-                "speech_rate_increase": 0.15,
-                "pitch_elevation": 0.32
-            },
+            stress_indicators=np.array([0.45, 0.15, 0.32], dtype=np.float32),
             deception_likelihood=0.22,
             credibility_score=0.78,
             health_indicators=["voice quality good", "no hoarseness"],
@@ -298,9 +817,27 @@ class VoiceBiometricSystem:
         
         return profile
     
-    def _generate_voice_print(self) -> List[float]:
-        """Generate unique voice fingerprint"""
-        return np.random.randn(256).tolist()
+    def _new_voice_print_pool(self) -> np.ndarray:
+        return self._rng.standard_normal(
+            size=(VOICE_PRINT_POOL_SIZE, VOICE_PRINT_DIM), dtype=np.float32
+        )
+    
+    def _voice_print(self, audio_stream: Any) -> np.ndarray:
+        """Embed raw audio samples when a model is configured, else draw from the pool"""
+        if self.embedding_backend is not None and isinstance(audio_stream, np.ndarray):
+            embedding = self.embedding_backend.infer(audio_stream.reshape(1, -1))
+            return np.asarray(embedding, dtype=np.float32).reshape(VOICE_PRINT_DIM)
+        return self._generate_voice_print()
+    
+    def _generate_voice_print(self) -> np.ndarray:
+        """Generate unique voice fingerprint (a view into a pre-drawn pool)"""
+        if self._voice_print_cursor == VOICE_PRINT_POOL_SIZE:
+            # Replace rather than refill so previously returned views stay valid
+            self._voice_print_pool = self._new_voice_print_pool()
+            self._voice_print_cursor = 0
+        voice_print = self._voice_print_pool[self._voice_print_cursor]
+        self._voice_print_cursor += 1
+        return voice_print
 
 
 class MicroGestureAnalyzer:
@@ -309,46 +846,43 @@ class MicroGestureAnalyzer:
     async def analyze_all_gestures(
         self,
         video_feed: Any,
-        subject_id: str
+        subject_id: str,
+        _now: Optional[datetime] = None
     ) -> MicroGestureAnalysis:
         """Comprehensive micro-gesture analysis"""
         
         analysis = MicroGestureAnalysis(
-            timestamp=datetime.now(),
-            detected_gestures=[
-                "Hand to face", "Crossed arms", "Forward lean",
-                "Eye contact reduced", "Jaw tension"
-            ],
-            self_touching_behaviors=[
-                {"behavior": "neck touching", "frequency": 3, "duration_ms": 450},
-                {"behavior": "ear touching", "frequency": 2, "duration_ms": 300}
-            ],
-            illustrator_gestures=[
-                {"gesture": "pointing", "emphasis": 0.7},
-                {"gesture": "open palm", "emphasis": 0.6}
-            ],
-            adaptor_behaviors=[
-                {"behavior": "leg bouncing", "anxiety_indicator": True},
-                {"behavior": "finger tapping", "anxiety_indicator": True}
-            ],
-            regulator_gestures=[
-                {"gesture": "head nod", "frequency": 5},
-                {"gesture": "eyebrow raise", "frequency": 3}
-            ],
-            emblematic_gestures=[
-                {"gesture": "thumbs up", "meaning": "agreement"}
-            ],
-            emotional_leakage=[
-                {"emotion": "concern", "duration_ms": 150, "face_region": "eyes"},
-                {"emotion": "tension", "duration_ms": 200, "face_region": "jaw"}
-            ],
-            deception_gesture_clusters=[
-                {
-                    "cluster_type": "self_touch_increase",
-                    "intensity": 0.35,
-                    "confidence": 0.68
-                }
-            ],
+            timestamp=_now or datetime.now(),
+            detected_gestures=np.array([
+                GestureLabel.HAND_TO_FACE, GestureLabel.CROSSED_ARMS, GestureLabel.FORWARD_LEAN,
+                GestureLabel.EYE_CONTACT_REDUCED, GestureLabel.JAW_TENSION
+            ], dtype=np.uint8),
+            self_touching_behaviors=np.array([
+                ("neck touching", 3, 450),
+                ("ear touching", 2, 300)
+            ], dtype=SELF_TOUCH_DTYPE),
+            illustrator_gestures=np.array([
+                ("pointing", 0.7),
+                ("open palm", 0.6)
+            ], dtype=ILLUSTRATOR_DTYPE),
+            adaptor_behaviors=np.array([
+                ("leg bouncing", True),
+                ("finger tapping", True)
+            ], dtype=ADAPTOR_DTYPE),
+            regulator_gestures=np.array([
+                ("head nod", 5),
+                ("eyebrow raise", 3)
+            ], dtype=REGULATOR_DTYPE),
+            emblematic_gestures=np.array([
+                ("thumbs up", "agreement")
+            ], dtype=EMBLEM_DTYPE),
+            emotional_leakage=np.array([
+                ("concern", 150, "eyes"),
+                ("tension", 200, "jaw")
+            ], dtype=LEAKAGE_DTYPE),
+            deception_gesture_clusters=np.array([
+                ("self_touch_increase", 0.35, 0.68)
+            ], dtype=DECEPTION_CLUSTER_DTYPE),
             confidence_indicators=[
                 "Stable eye contact",
                 "Open posture",
@@ -364,48 +898,59 @@ class MicroGestureAnalyzer:
         return analysis
 
 
+_COPING_MECHANISMS: Tuple[str, ...] = ("Physical tension", "Verbal expression", "Breathing changes")
+
+
 class StressPatternDetector:
     """Detect stress patterns from behavioral observations"""
     
     async def detect_stress(
         self,
-        observations: List[Dict],
+        observations: Union[List[Dict], np.ndarray],
         subject_id: str
     ) -> Dict[str, Any]:
         """Detect stress patterns"""
         
-        stress_indicators = []
-        stress_level = 0.0
-        
-        for obs in observations:
-            if obs.get("stress_indicator"):
-                stress_indicators.append(obs.get("type", "unknown"))
-                stress_level += 0.15
+        if isinstance(observations, np.ndarray):
+            # Pre-parsed OBSERVATION_DTYPE records
+            types = observations["type"]
+            flags = observations["stress_indicator"]
+        else:
+            types = np.array([obs.get("type", "unknown") for obs in observations], dtype=object)
+            flags = np.fromiter(
+                (bool(obs.get("stress_indicator")) for obs in observations),
+                dtype=bool,
+                count=len(observations)
+            )
         
-        stress_level = min(1.0, stress_level)
+        stress_indicators = types[flags].tolist()
+        stress_level = min(1.0, 0.15 * int(flags.sum()))
         
         return {
             "stress_level": stress_level * 100,
             "indicators": stress_indicators,
-            "coping_mechanisms": await self._assess_coping(observations),
+            "coping_mechanisms": self._assess_coping(observations),
             "resilience_level": max(0, 100 - (stress_level * 100)),
             "intervention_recommended": stress_level > 0.7
         }
     
-    async def _assess_coping(self, observations: List[Dict]) -> List[str]:
+    def _assess_coping(self, observations: List[Dict]) -> Tuple[str, ...]:
         """Assess coping mechanisms"""
-        return ["Physical tension", "Verbal expression", "Breathing changes"]
+        return _COPING_MECHANISMS
+
+
+_MOVEMENT_QUALITY: Mapping[str, Any] = MappingProxyType({
+    "fluidity": 0.87,
+    "coordination": 0.92,
+    "balance": 0.89,
+    "strength_indicators": "normal",
+    "flexibility_indicators": "moderate"
+})
 
 
 class MovementQualityAssessor:
     """Assess overall movement quality and health"""
     
-    async def assess(self, observations: List[Dict]) -> Dict[str, Any]:
+    def assess(self, observations: List[Dict]) -> Dict[str, Any]:
         """Assess movement quality"""
-        return {
-            "fluidity": 0.87,
-            "coordination": 0.92,
-            "balance": 0.89,
-            "strength_indicators": "normal",
-            "flexibility_indicators": "moderate"
-        }
+        return dict(_MOVEMENT_QUALITY)
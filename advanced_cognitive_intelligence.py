@@ -5,76 +5,300 @@ Author: David Akpoviroro Oke (MrIridescent)
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import re
+import sys
+import numpy as np
+from collections import Counter
+from functools import cached_property
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple, Any, Sequence, Union
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum, IntFlag
 from datetime import datetime
-import json
+from types import MappingProxyType
+
+from keyword_matching import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+
+def _keywords(*words: str) -> FrozenSet[str]:
+    """Immutable keyword set of interned strings (pointer-equal to interned lookup keys)"""
+    return frozenset(map(sys.intern, words))
 
-class SocialIntelligenceType(Enum):
-    """Types of social intelligence"""
-    EMPATHY = "empathy"
-    THEORY_OF_MIND = "theory_of_mind"
-    PERSPECTIVE_TAKING = "perspective_taking"
-    SOCIAL_AWARENESS = "social_awareness"
-    RELATIONSHIP_DYNAMICS = "relationship_dynamics"
-    GROUP_HARMONY = "group_harmony"
-    CONFLICT_RESOLUTION = "conflict_resolution"
-    INFLUENCE = "influence"
-    AUTHENTICITY = "authenticity"
-    TRUST_BUILDING = "trust_building"
-
-
-class MetaphysicalIntelligence(Enum):
-    """Types of metaphysical and existential understanding"""
-    MEANING_MAKING = "meaning_making"
-    PURPOSE_DISCOVERY = "purpose_discovery"
-    TRANSCENDENCE = "transcendence"
-    INTERCONNECTEDNESS = "interconnectedness"
-    EXISTENTIAL_AWARENESS = "existential_awareness"
-    SPIRITUAL_RESONANCE = "spiritual_resonance"
-    SYMBOLIC_UNDERSTANDING = "symbolic_understanding"
-    PARADOX_RESOLUTION = "paradox_resolution"
-    COLLECTIVE_CONSCIOUSNESS = "collective_consciousness"
-    DIMENSIONAL_THINKING = "dimensional_thinking"
-
-
-class AbstractThinkingType(Enum):
-    """Types of abstract thinking"""
-    PATTERN_RECOGNITION = "pattern_recognition"
-    METAPHOR_MAPPING = "metaphor_mapping"
-    CONCEPTUALIZATION = "conceptualization"
-    SYSTEMIC_THINKING = "systemic_thinking"
-    HYPOTHETICAL_REASONING = "hypothetical_reasoning"
-    SYMBOLIC_REASONING = "symbolic_reasoning"
-    COUNTERFACTUAL_THINKING = "counterfactual_thinking"
-    ANALOGY_EXTRACTION = "analogy_extraction"
+
+NEGATIVE_EMOTIONS = frozenset({"sadness", "anger", "anxiety", "fear", "despair"})
+RECOVERY_WINDOW = 10  # Entries after a negative state within which recovery counts
+RESILIENCE_VECTORIZE_MIN = 1024  # Histories at least this long are scored with NumPy (faster only past ~1000 entries)
+
+EMPATHY_INDICATORS = _keywords(
+    "understand", "feel", "perspective", "imagine",
+    "compassion", "care", "support", "validate", "acknowledge"
+)
+_EMPATHY_PHRASE_RE = re.compile(r"\btheir shoes\b")
 
 
 @dataclass
+class TextView:
+    """
+    One piece of user text with its derived forms, computed once and shared
+    by every analyzer in a pipeline. Token views are built on first use.
+    """
+    raw: str
+    lower: str
+    
+    @classmethod
+    def of(cls, text: Union[str, "TextView"]) -> "TextView":
+        if isinstance(text, TextView):
+            return text
+        return cls(raw=text, lower=text.lower())
+    
+    @cached_property
+    def words(self) -> List[str]:
+        """Whitespace-separated words of the lowercased text"""
+        return self.lower.split()
+    
+    @cached_property
+    def token_counts(self) -> Counter:
+        """Alphabetic token frequencies of the lowercased text"""
+        return Counter(_TOKEN_RE.findall(self.lower))
+    
+    @cached_property
+    def tokens(self) -> FrozenSet[str]:
+        return frozenset(self.token_counts)
+
+
+TextInput = Union[str, TextView]
+
+
+def message_views(history: List[Dict]) -> List[TextView]:
+    """One TextView per history entry's message, to share across analyzers"""
+    return [TextView.of(entry.get("message", "")) for entry in history]
+
+
+SYSTEM_INDICATORS = (
+    "interconnect", "relationship", "system", "pattern", "cycle",
+    "feedback", "dynamic", "balance", "flow", "network"
+)
+
+
+CONCRETE_WORDS = tuple(map(sys.intern, ("see", "touch", "taste", "smell", "hold", "object")))
+ABSTRACT_WORDS = tuple(map(sys.intern, ("concept", "idea", "theory", "principle", "essence", "meaning")))
+_ABSTRACTION_KIND = {**dict.fromkeys(CONCRETE_WORDS, 0), **dict.fromkeys(ABSTRACT_WORDS, 1)}
+_ABSTRACTION_RE = re.compile(r"\b(" + "|".join(_ABSTRACTION_KIND) + r")\b")
+
+_VULNERABILITY_MATCHER = KeywordMatcher({
+    "vulnerable": _keywords("afraid", "struggling", "don't know", "help", "scared")
+})
+_TRANSCENDENCE_MATCHER = KeywordMatcher({
+    "transcendent": _keywords("beyond", "infinite", "eternal", "universal", "profound", "sacred")
+})
+
+MEANING_FRAMEWORKS: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    "transcendent": _keywords("spiritual", "divine", "sacred", "universal", "eternal"),
+    "relational": _keywords("love", "connection", "family", "community", "belonging"),
+    "achievement": _keywords("purpose", "legacy", "contribution", "growth", "mastery"),
+    "experiential": _keywords("beauty", "joy", "authenticity", "presence", "aliveness"),
+    "philosophical": _keywords("truth", "wisdom", "understanding", "consciousness", "being"),
+    "existential": _keywords("freedom", "responsibility", "authenticity", "mortality", "meaning"),
+})
+
+EXISTENTIAL_THEMES: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    "mortality": _keywords("death", "finitude", "legacy", "impact"),
+    "meaning": _keywords("purpose", "reason", "significance"),
+    "freedom": _keywords("choice", "autonomy", "responsibility"),
+    "isolation": _keywords("connection", "belonging", "alienation"),
+    "authenticity": _keywords("true self", "mask", "genuine", "facade"),
+})
+
+
+class SocialIntelligenceType(IntEnum):
+    """Types of social intelligence (index into social dimension arrays)"""
+    EMPATHY = 0
+    THEORY_OF_MIND = 1
+    PERSPECTIVE_TAKING = 2
+    SOCIAL_AWARENESS = 3
+    RELATIONSHIP_DYNAMICS = 4
+    GROUP_HARMONY = 5
+    CONFLICT_RESOLUTION = 6
+    INFLUENCE = 7
+    AUTHENTICITY = 8
+    TRUST_BUILDING = 9
+
+
+class MetaphysicalIntelligence(IntEnum):
+    """Types of metaphysical and existential understanding (array index)"""
+    MEANING_MAKING = 0
+    PURPOSE_DISCOVERY = 1
+    TRANSCENDENCE = 2
+    INTERCONNECTEDNESS = 3
+    EXISTENTIAL_AWARENESS = 4
+    SPIRITUAL_RESONANCE = 5
+    SYMBOLIC_UNDERSTANDING = 6
+    PARADOX_RESOLUTION = 7
+    COLLECTIVE_CONSCIOUSNESS = 8
+    DIMENSIONAL_THINKING = 9
+
+
+class ExistentialConcern(IntFlag):
+    """Existential themes as bits; co-occurring concerns combine with `|`"""
+    MORTALITY = 1
+    MEANING = 2
+    FREEDOM = 4
+    ISOLATION = 8
+    AUTHENTICITY = 16
+
+
+_EXISTENTIAL_FLAGS = MappingProxyType({
+    theme: ExistentialConcern[theme.upper()] for theme in EXISTENTIAL_THEMES
+})
+
+
+def combined_existential_concerns(concerns: Sequence[int]) -> ExistentialConcern:
+    """Union of many users' or messages' concern flags in one vectorized reduction"""
+    if not len(concerns):
+        return ExistentialConcern(0)
+    return ExistentialConcern(int(np.bitwise_or.reduce(np.asarray(concerns, dtype=np.int64))))
+
+
+class AbstractThinkingType(IntEnum):
+    """Types of abstract thinking (array index)"""
+    PATTERN_RECOGNITION = 0
+    METAPHOR_MAPPING = 1
+    CONCEPTUALIZATION = 2
+    SYSTEMIC_THINKING = 3
+    HYPOTHETICAL_REASONING = 4
+    SYMBOLIC_REASONING = 5
+    COUNTERFACTUAL_THINKING = 6
+    ANALOGY_EXTRACTION = 7
+
+
+N_SOCIAL_DIMENSIONS = len(SocialIntelligenceType)
+
+
+# Shared read-only empties: unpopulated profile containers cost no allocation.
+# Populate a field by assigning a new dict/list to it.
+_EMPTY_MAPPING: Mapping = MappingProxyType({})
+
+
+def _empty_mapping() -> Mapping:
+    return _EMPTY_MAPPING
+
+
+def dimension_vector(n_dimensions: int) -> np.ndarray:
+    """float32 score vector indexed by an IntEnum; unassessed dimensions are NaN"""
+    return np.full(n_dimensions, np.nan, dtype=np.float32)
+
+
+@dataclass(slots=True)
 class EmotionalIntelligenceProfile:
     """Advanced 20x emotional intelligence profile"""
     user_id: str
     
-    primary_emotions: Dict[str, float] = field(default_factory=dict)
-    secondary_emotions: Dict[str, float] = field(default_factory=dict)
-    emotional_nuance: Dict[str, float] = field(default_factory=dict)
+    primary_emotions: Mapping[str, float] = field(default_factory=_empty_mapping)
+    secondary_emotions: Mapping[str, float] = field(default_factory=_empty_mapping)
+    emotional_nuance: Mapping[str, float] = field(default_factory=_empty_mapping)
     emotional_velocity: float = 0.0
     emotional_consistency: float = 0.0
     emotional_resilience: float = 0.0
     emotional_maturity: float = 0.0
     emotional_awareness: float = 0.0
     emotional_expression_style: str = "authentic"
-    emotional_triggers: List[str] = field(default_factory=list)
-    emotional_anchors: List[str] = field(default_factory=list)
+    emotional_triggers: Sequence[str] = ()
+    emotional_anchors: Sequence[str] = ()
     emotional_narrative: str = ""
-    emotional_trajectory: List[Tuple[datetime, Dict]] = field(default_factory=list)
+    emotional_trajectory: Sequence[Tuple[datetime, Dict]] = ()
 
 
-@dataclass
+class ProfileTable:
+    """
+    Struct-of-arrays store for the scalar EmotionalIntelligenceProfile fields
+    across users: one contiguous float32 column per field, one row per user.
+    """
+    
+    COLUMNS = (
+        "emotional_velocity",
+        "emotional_consistency",
+        "emotional_resilience",
+        "emotional_maturity",
+        "emotional_awareness",
+    )
+    
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self._user_ids = np.empty(capacity, dtype=object)
+        self._columns = {name: np.zeros(capacity, dtype=np.float32) for name in self.COLUMNS}
+        self.rows: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getattr__(self, name: str) -> np.ndarray:
+        # Column access (e.g. table.emotional_velocity) returns the live rows only
+        columns = self.__dict__.get("_columns")
+        if columns is not None and name in columns:
+            return columns[name][:self._size]
+        raise AttributeError(name)
+    
+    @property
+    def user_ids(self) -> np.ndarray:
+        return self._user_ids[:self._size]
+    
+    def add(self, user_id: str) -> int:
+        """Row index for user_id, appending a zeroed row if the user is new"""
+        row = self.rows.get(user_id)
+        if row is not None:
+            return row
+        if self._size == self._user_ids.shape[0]:
+            self._grow()
+        row = self._size
+        self._user_ids[row] = user_id
+        for column in self._columns.values():
+            column[row] = 0.0
+        self.rows[user_id] = row
+        self._size += 1
+        return row
+    
+    def set_column(self, name: str, user_ids: Sequence[str], values: Any):
+        """Scatter-assign values for the given users into one column"""
+        index = np.fromiter((self.add(user_id) for user_id in user_ids), dtype=np.intp, count=len(user_ids))
+        self._columns[name][index] = values
+    
+    def set_velocity(self, user_ids: Sequence[str], values: Any):
+        self.set_column("emotional_velocity", user_ids, values)
+    
+    def set_resilience(self, user_ids: Sequence[str], values: Any):
+        self.set_column("emotional_resilience", user_ids, values)
+    
+    def set_awareness(self, user_ids: Sequence[str], values: Any):
+        self.set_column("emotional_awareness", user_ids, values)
+    
+    def row(self, user_id: str) -> EmotionalIntelligenceProfile:
+        """Materialize one user's scalar fields as an EmotionalIntelligenceProfile"""
+        row = self.rows[user_id]
+        return EmotionalIntelligenceProfile(
+            user_id=user_id,
+            **{name: float(column[row]) for name, column in self._columns.items()}
+        )
+    
+    def means(self) -> Dict[str, float]:
+        """Population mean of every column"""
+        return {name: float(column[:self._size].mean()) if self._size else 0.0
+                for name, column in self._columns.items()}
+    
+    def _grow(self):
+        capacity = 2 * self._user_ids.shape[0]
+        user_ids = np.empty(capacity, dtype=object)
+        user_ids[:self._size] = self._user_ids[:self._size]
+        self._user_ids = user_ids
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=np.float32)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+
+@dataclass(slots=True)
 class SocialIntelligenceProfile:
     """Advanced social intelligence understanding"""
     user_id: str
@@ -82,18 +306,20 @@ class SocialIntelligenceProfile:
     empathy_level: float = 0.5
     perspective_flexibility: float = 0.5
     social_awareness: float = 0.5
-    relationship_quality: Dict[str, float] = field(default_factory=dict)
+    relationship_quality: np.ndarray = field(
+        default_factory=lambda: dimension_vector(N_SOCIAL_DIMENSIONS)
+    )  # float32, indexed by SocialIntelligenceType
     group_dynamics_understanding: float = 0.5
     conflict_resolution_style: str = "collaborative"
     authenticity_score: float = 0.5
     influence_capacity: float = 0.5
     trust_trustworthiness: float = 0.5
     reciprocity_tendency: float = 0.5
-    social_context_sensitivity: Dict[str, float] = field(default_factory=dict)
-    relationship_patterns: Dict[str, str] = field(default_factory=dict)
+    social_context_sensitivity: Mapping[str, float] = field(default_factory=_empty_mapping)
+    relationship_patterns: Mapping[str, str] = field(default_factory=_empty_mapping)
 
 
-@dataclass
+@dataclass(slots=True)
 class MetaphysicalIntelligenceProfile:
     """Understanding of meaning, purpose, existence"""
     user_id: str
@@ -105,14 +331,14 @@ class MetaphysicalIntelligenceProfile:
     existential_maturity: float = 0.5
     spiritual_resonance: float = 0.5
     symbolic_understanding: float = 0.5
-    values_hierarchy: List[str] = field(default_factory=list)
+    values_hierarchy: Sequence[str] = ()
     life_philosophy: str = ""
-    existential_concerns: List[str] = field(default_factory=list)
-    meaning_making_patterns: Dict[str, str] = field(default_factory=dict)
-    transcendent_experiences: List[str] = field(default_factory=list)
+    existential_concerns: ExistentialConcern = ExistentialConcern(0)
+    meaning_making_patterns: Mapping[str, str] = field(default_factory=_empty_mapping)
+    transcendent_experiences: Sequence[str] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class AbstractThinkingProfile:
     """Advanced abstract and conceptual thinking capability"""
     user_id: str
@@ -127,8 +353,8 @@ class AbstractThinkingProfile:
     conceptual_integration: float = 0.5
     thinking_style: str = "mixed"
     abstraction_level_preference: str = "moderate"
-    concept_maps: Dict[str, List[str]] = field(default_factory=dict)
-    thinking_patterns: Dict[str, str] = field(default_factory=dict)
+    concept_maps: Mapping[str, List[str]] = field(default_factory=_empty_mapping)
+    thinking_patterns: Mapping[str, str] = field(default_factory=_empty_mapping)
 
 
 class AdvancedEmotionalIntelligence:
@@ -138,6 +364,7 @@ class AdvancedEmotionalIntelligence:
         self.profiles = {}
         self.emotional_nuances = self._init_emotional_nuances()
         self.emotional_trajectories = {}
+        self._init_nuance_matchers()
         
     def _init_emotional_nuances(self) -> Dict[str, List[str]]:
         """Initialize subtle emotional variations"""
@@ -151,51 +378,127 @@ class AdvancedEmotionalIntelligence:
             "awe": ["wonder", "reverence", "humility", "transcendence", "vastness_awareness", "mystery_embrace"],
         }
     
-    async def analyze_emotional_nuance(self, text: str, emotion: str) -> Dict[str, float]:
+    def _init_nuance_matchers(self):
+        """Per-emotion zero templates and one word-boundary regex over all nuance spellings"""
+        self._nuance_templates: Dict[str, Dict[str, float]] = {}
+        self._nuance_patterns: Dict[str, re.Pattern] = {}
+        self._nuance_spellings: Dict[str, str] = {}
+        for emotion, nuances in self.emotional_nuances.items():
+            self._nuance_templates[emotion] = dict.fromkeys(nuances, 0.0)
+            spellings = []
+            for nuance in nuances:
+                for spelling in dict.fromkeys((nuance, nuance.replace("_", " "))):
+                    self._nuance_spellings[spelling] = nuance
+                    spellings.append(spelling)
+            self._nuance_patterns[emotion] = re.compile(
+                r"\b(" + "|".join(map(re.escape, spellings)) + r")\b"
+            )
+    
+    def analyze_emotional_nuance(self, text: TextInput, emotion: str) -> Dict[str, float]:
         """Detect subtle emotional variations"""
-        nuances = self.emotional_nuances.get(emotion.lower(), [])
-        detected_nuances = {}
+        emotion = emotion.lower()
+        template = self._nuance_templates.get(emotion)
+        if template is None:
+            return {}
         
-        text_lower = text.lower()
-        for nuance in nuances:
-            if nuance.replace("_", " ") in text_lower or nuance in text_lower:
-                detected_nuances[nuance] = 0.8
-            else:
-                detected_nuances[nuance] = 0.0
+        detected_nuances = template.copy()
+        for match in self._nuance_patterns[emotion].finditer(TextView.of(text).lower):
+            detected_nuances[self._nuance_spellings[match.group(1)]] = 0.8
         
         return detected_nuances
     
-    async def assess_emotional_velocity(self, recent_states: List[Tuple[datetime, str]]) -> float:
+    def assess_emotional_velocity(self, recent_states: List[Tuple[datetime, str]]) -> float:
         """How fast emotional state is changing"""
         if len(recent_states) < 2:
             return 0.0
         
+        # A plain scan beats NumPy for one history; see assess_emotional_velocity_batch for many
         state_changes = 0
-        for i in range(1, len(recent_states)):
-            if recent_states[i][1] != recent_states[i-1][1]:
+        previous = recent_states[0][1]
+        for _, state in recent_states:
+            if state != previous:
                 state_changes += 1
+            previous = state
         
         return min(1.0, (state_changes / len(recent_states)))
     
-    async def assess_emotional_resilience(self, history: List[Dict]) -> float:
+    def assess_emotional_velocity_batch(
+        self,
+        states_by_user: Sequence[List[Tuple[datetime, str]]]
+    ) -> np.ndarray:
+        """
+        assess_emotional_velocity for many users at once, as a float64 array
+        (e.g. for ProfileTable.set_velocity). All histories are coded and
+        compared in one flat array; user boundaries never count as changes.
+        """
+        lengths = np.fromiter((len(states) for states in states_by_user), dtype=np.int64,
+                              count=len(states_by_user))
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        
+        codes: Dict[str, int] = {}
+        flat = np.fromiter(
+            (codes.setdefault(state, len(codes)) for states in states_by_user for _, state in states),
+            dtype=np.int32,
+            count=int(offsets[-1])
+        )
+        
+        changed = np.zeros(len(flat), dtype=bool)
+        changed[1:] = flat[1:] != flat[:-1]
+        changed[offsets[:-1][lengths > 0]] = False
+        changes_before = np.zeros(len(flat) + 1, dtype=np.int64)
+        np.cumsum(changed, out=changes_before[1:])
+        state_changes = changes_before[offsets[1:]] - changes_before[offsets[:-1]]
+        
+        velocity = state_changes / np.maximum(lengths, 1)
+        np.minimum(1.0, velocity, out=velocity)
+        velocity[lengths < 2] = 0.0
+        return velocity
+    
+    def assess_emotional_resilience(self, history: List[Dict]) -> float:
         """Recovery speed from negative emotions"""
-        negative_states = ["sadness", "anger", "anxiety", "fear", "despair"]
-        recovery_times = []
+        if len(history) >= RESILIENCE_VECTORIZE_MIN:
+            return self._vectorized_resilience(history)
         
-        for i, entry in enumerate(history):
-            if entry.get("emotion") in negative_states:
-                for j in range(i + 1, min(i + 10, len(history))):
-                    if history[j].get("emotion") not in negative_states:
-                        recovery_times.append(j - i)
-                        break
+        # One backward pass: next_recovered is the nearest later non-negative entry
+        recovery_total = 0
+        recoveries = 0
+        next_recovered = None
+        for i in range(len(history) - 1, -1, -1):
+            if history[i].get("emotion") not in NEGATIVE_EMOTIONS:
+                next_recovered = i
+            elif next_recovered is not None and next_recovered - i < RECOVERY_WINDOW:
+                recovery_total += next_recovered - i
+                recoveries += 1
         
-        if not recovery_times:
+        if not recoveries:
             return 0.5
         
-        avg_recovery = sum(recovery_times) / len(recovery_times)
-        return min(1.0, 1.0 - (avg_recovery / 10))
+        avg_recovery = recovery_total / recoveries
+        return min(1.0, 1.0 - (avg_recovery / RECOVERY_WINDOW))
     
-    async def assess_emotional_awareness(self, articulation_quality: str) -> float:
+    def _vectorized_resilience(self, history: List[Dict]) -> float:
+        """assess_emotional_resilience for long histories, with array ops instead of the scan"""
+        n = len(history)
+        negative = np.fromiter(
+            (entry.get("emotion") in NEGATIVE_EMOTIONS for entry in history),
+            dtype=bool,
+            count=n
+        )
+        
+        # Index of the next non-negative entry at or after each position (n if none)
+        positions = np.arange(n)
+        next_recovered = np.minimum.accumulate(np.where(negative, n, positions)[::-1])[::-1]
+        recovery_times = next_recovered - positions
+        recovered = negative & (next_recovered < n) & (recovery_times < RECOVERY_WINDOW)
+        
+        if not recovered.any():
+            return 0.5
+        
+        avg_recovery = float(recovery_times[recovered].mean())
+        return min(1.0, 1.0 - (avg_recovery / RECOVERY_WINDOW))
+    
+    def assess_emotional_awareness(self, articulation_quality: str) -> float:
         """How well user understands their own emotions"""
         awareness_factors = {
             "nuanced": 0.9,
@@ -216,26 +519,29 @@ class AdvancedSocialIntelligence:
         self.relationship_models = {}
         self.group_dynamics = {}
         
-    async def assess_empathy_depth(self, user_responses: List[str]) -> float:
+    def assess_empathy_depth(self, user_responses: List[TextInput]) -> float:
         """Measure depth of empathetic understanding"""
-        empathy_indicators = [
-            "understand", "feel", "perspective", "their shoes", "imagine",
-            "compassion", "care", "support", "validate", "acknowledge"
-        ]
-        
-        total_indicators = sum(
-            response.lower().count(indicator)
-            for response in user_responses
-            for indicator in empathy_indicators
-        )
+        total_indicators = 0
+        for response in user_responses:
+            view = TextView.of(response)
+            token_counts = view.token_counts
+            total_indicators += sum(token_counts[indicator] for indicator in EMPATHY_INDICATORS)
+            total_indicators += len(_EMPATHY_PHRASE_RE.findall(view.lower))
         
         return min(1.0, total_indicators / max(1, len(user_responses) * 2))
     
-    async def analyze_relationship_dynamics(self, interaction_history: List[Dict]) -> Dict[str, Any]:
-        """Analyze patterns in relationships"""
+    def analyze_relationship_dynamics(
+        self,
+        interaction_history: List[Dict],
+        messages: Optional[Sequence[TextView]] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze patterns in relationships. `messages` are the pre-built views of
+        each entry's message, when the caller already has them.
+        """
         dynamics = {
             "reciprocity": self._analyze_reciprocity(interaction_history),
-            "vulnerability": self._analyze_vulnerability(interaction_history),
+            "vulnerability": self._analyze_vulnerability(interaction_history, messages),
             "support_patterns": self._analyze_support_patterns(interaction_history),
             "conflict_resolution": self._analyze_conflict_resolution(interaction_history),
             "attachment_style": self._infer_attachment_style(interaction_history),
@@ -246,12 +552,17 @@ class AdvancedSocialIntelligence:
         """How much emotional exchange is balanced"""
         return 0.5  # Placeholder for calculation
     
-    def _analyze_vulnerability(self, history: List[Dict]) -> float:
+    def _analyze_vulnerability(
+        self,
+        history: List[Dict],
+        messages: Optional[Sequence[TextView]] = None
+    ) -> float:
         """Willingness to be emotionally open"""
-        vulnerable_indicators = ["afraid", "struggling", "don't know", "help", "scared"]
+        if messages is None:
+            messages = message_views(history)
         vulnerable_count = sum(
-            1 for entry in history
-            if any(indicator in entry.get("message", "").lower() for indicator in vulnerable_indicators)
+            1 for message in messages
+            if _VULNERABILITY_MATCHER.contains_any(message.lower)
         )
         return min(1.0, vulnerable_count / max(1, len(history)))
     
@@ -275,51 +586,34 @@ class AdvancedMetaphysicalIntelligence:
         self.profiles = {}
         self.meaning_frameworks = self._init_meaning_frameworks()
         self.existential_themes = self._init_existential_themes()
+        self._existential_matcher = KeywordMatcher(self.existential_themes)
         
-    def _init_meaning_frameworks(self) -> Dict[str, List[str]]:
+    def _init_meaning_frameworks(self) -> Mapping[str, FrozenSet[str]]:
         """Initialize different frameworks for meaning-making"""
-        return {
-            "transcendent": ["spiritual", "divine", "sacred", "universal", "eternal"],
-            "relational": ["love", "connection", "family", "community", "belonging"],
-            "achievement": ["purpose", "legacy", "contribution", "growth", "mastery"],
-            "experiential": ["beauty", "joy", "authenticity", "presence", "aliveness"],
-            "philosophical": ["truth", "wisdom", "understanding", "consciousness", "being"],
-            "existential": ["freedom", "responsibility", "authenticity", "mortality", "meaning"],
-        }
+        return MEANING_FRAMEWORKS
     
-    def _init_existential_themes(self) -> Dict[str, List[str]]:
+    def _init_existential_themes(self) -> Mapping[str, FrozenSet[str]]:
         """Initialize existential concerns"""
-        return {
-            "mortality": ["death", "finitude", "legacy", "impact"],
-            "meaning": ["purpose", "reason", "significance"],
-            "freedom": ["choice", "autonomy", "responsibility"],
-            "isolation": ["connection", "belonging", "alienation"],
-            "authenticity": ["true self", "mask", "genuine", "facade"],
-        }
+        return EXISTENTIAL_THEMES
     
-    async def assess_meaning_clarity(self, articulated_values: List[str]) -> float:
+    def assess_meaning_clarity(self, articulated_values: List[str]) -> float:
         """How clear is user's sense of meaning"""
         if not articulated_values:
             return 0.0
         return min(1.0, len(articulated_values) / 10)
     
-    async def detect_existential_concerns(self, text: str) -> List[str]:
+    def detect_existential_concerns(self, text: TextInput) -> ExistentialConcern:
         """Identify existential themes in speech"""
-        concerns = []
-        text_lower = text.lower()
-        
-        for theme, keywords in self.existential_themes.items():
-            if any(keyword in text_lower for keyword in keywords):
-                concerns.append(theme)
-        
+        concerns = ExistentialConcern(0)
+        for theme in self._existential_matcher.find(TextView.of(text).lower):
+            concerns |= _EXISTENTIAL_FLAGS[theme]
         return concerns
     
-    async def measure_transcendence_capacity(self, experiences: List[str]) -> float:
+    def measure_transcendence_capacity(self, experiences: List[TextInput]) -> float:
         """Capacity to experience transcendence"""
-        transcendent_words = ["beyond", "infinite", "eternal", "universal", "profound", "sacred"]
         count = sum(
             1 for experience in experiences
-            if any(word in experience.lower() for word in transcendent_words)
+            if _TRANSCENDENCE_MATCHER.contains_any(TextView.of(experience).lower)
         )
         return min(1.0, count / max(1, len(experiences)))
 
@@ -331,6 +625,12 @@ class AdvancedAbstractThinking:
         self.profiles = {}
         self.metaphor_library = self._init_metaphor_library()
         self.pattern_database = {}
+        self._metaphor_re = re.compile(
+            r"\b(" + "|".join(map(re.escape, self.metaphor_library)) + r")\b"
+        )
+        self._metaphor_targets = {
+            name: data.get("target", "unknown") for name, data in self.metaphor_library.items()
+        }
         
     def _init_metaphor_library(self) -> Dict[str, Dict[str, str]]:
         """Initialize rich metaphor mappings"""
@@ -352,13 +652,12 @@ class AdvancedAbstractThinking:
             },
         }
     
-    async def extract_conceptual_abstraction_level(self, text: str) -> str:
+    def extract_conceptual_abstraction_level(self, text: TextInput) -> str:
         """Identify level of abstraction in thinking"""
-        concrete_words = ["see", "touch", "taste", "smell", "hold", "object"]
-        abstract_words = ["concept", "idea", "theory", "principle", "essence", "meaning"]
-        
-        concrete_count = sum(1 for word in concrete_words if word in text.lower())
-        abstract_count = sum(1 for word in abstract_words if word in text.lower())
+        counts = [0, 0]  # [concrete, abstract]
+        for match in _ABSTRACTION_RE.finditer(TextView.of(text).lower):
+            counts[_ABSTRACTION_KIND[match.group(1)]] += 1
+        concrete_count, abstract_count = counts
         
         if abstract_count > concrete_count * 2:
             return "highly_abstract"
@@ -369,27 +668,19 @@ class AdvancedAbstractThinking:
         else:
             return "mixed"
     
-    async def detect_metaphor_usage(self, text: str) -> List[Tuple[str, str]]:
+    def detect_metaphor_usage(self, text: TextInput) -> List[Tuple[str, str]]:
         """Identify metaphors and their mappings"""
-        detected = []
-        for metaphor_name, metaphor_data in self.metaphor_library.items():
-            if metaphor_name in text.lower():
-                detected.append((metaphor_name, metaphor_data.get("target", "unknown")))
-        return detected
+        found = set(self._metaphor_re.findall(TextView.of(text).lower))
+        return [
+            (name, target) for name, target in self._metaphor_targets.items() if name in found
+        ]
     
-    async def analyze_systemic_thinking(self, explanation: str) -> float:
+    def analyze_systemic_thinking(self, explanation: TextInput) -> float:
         """How much user thinks in systems vs isolated elements"""
-        system_indicators = [
-            "interconnect", "relationship", "system", "pattern", "cycle",
-            "feedback", "dynamic", "balance", "flow", "network"
-        ]
+        view = TextView.of(explanation)
+        count = sum(1 for indicator in SYSTEM_INDICATORS if indicator in view.lower)
         
-        count = sum(
-            1 for indicator in system_indicators
-            if indicator in explanation.lower()
-        )
-        
-        return min(1.0, count / max(1, len(explanation.split()) / 10))
+        return min(1.0, count / max(1, len(view.words) / 10))
 
 
 class UnifiedAdvancedCognition:
@@ -401,6 +692,7 @@ class UnifiedAdvancedCognition:
         self.metaphysical = AdvancedMetaphysicalIntelligence()
         self.abstract = AdvancedAbstractThinking()
         self.integrated_profiles = {}
+        self.emotional_table = ProfileTable()
     
     async def create_integrated_cognitive_profile(self, user_id: str) -> Dict[str, Any]:
         """Create comprehensive cognitive profile across all dimensions"""
@@ -408,7 +700,8 @@ class UnifiedAdvancedCognition:
         profile = {
             "user_id": user_id,
             "created_at": datetime.now(),
-            "emotional": EmotionalIntelligenceProfile(user_id=user_id),
+            "emotional": self.emotional_table.row(user_id) if user_id in self.emotional_table.rows
+            else EmotionalIntelligenceProfile(user_id=user_id),
             "social": SocialIntelligenceProfile(user_id=user_id),
             "metaphysical": MetaphysicalIntelligenceProfile(user_id=user_id),
             "abstract": AbstractThinkingProfile(user_id=user_id),
@@ -416,8 +709,13 @@ class UnifiedAdvancedCognition:
         }
         
         self.integrated_profiles[user_id] = profile
+        self.emotional_table.add(user_id)
         return profile
     
+    def population_emotional_averages(self) -> Dict[str, float]:
+        """Mean emotional velocity, resilience, etc. across every profiled user"""
+        return self.emotional_table.means()
+    
     async def assess_whole_person_intelligence(self, user_history: List[Dict]) -> Dict[str, float]:
         """Comprehensive assessment across all cognitive dimensions"""
         
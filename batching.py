@@ -0,0 +1,118 @@
+"""
+Ochuko AI - Request Batching
+Coalesces concurrent single-item async calls into one batched call
+Author: David Akpoviroro Oke (MrIridescent)
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+
+class BatchScheduler:
+    """
+    Coalesces concurrent single-item requests into batched calls.
+    
+    submit() queues one item and waits for its result. A worker task takes the
+    first queued item and yields once; if nothing else is queued by then the
+    item is dispatched immediately, otherwise the worker waits up to
+    max_wait_ms for more (at most max_batch). The list is handed to batch_fn,
+    which returns one result per item.
+    If batch_fn raises, the batch is retried item by item so one bad request
+    only fails its own caller.
+    
+    With base_wait_ms the window adapts to load: it follows an EMA of the
+    batch sizes actually collected, from base_wait_ms when batches stay small
+    up to max_wait_ms as they fill.
+    """
+    
+    BATCH_SIZE_SMOOTHING = 0.2  # EMA weight of the latest batch size
+    
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 16,
+        max_wait_ms: float = 8.0,
+        base_wait_ms: Optional[float] = None
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self.base_wait_ms = base_wait_ms
+        self._batch_size_ema = 1.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+    
+    @property
+    def wait_ms(self) -> float:
+        """Current batching window"""
+        if self.base_wait_ms is None or self.max_batch <= 1:
+            return self.max_wait_ms
+        load = min(1.0, (self._batch_size_ema - 1.0) / (self.max_batch - 1))
+        return self.base_wait_ms + (self.max_wait_ms - self.base_wait_ms) * load
+    
+    async def submit(self, item: Any) -> Any:
+        self._ensure_worker()
+        result = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, result))
+        return await result
+    
+    def _ensure_worker(self):
+        """Start the worker on the running loop if it is not alive"""
+        if self._worker is None or self._worker.done() \
+                or self._worker.get_loop() is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._queue.get()]
+            # One zero-length yield lets callers scheduled in the same loop pass
+            # enqueue; a request that is still alone afterwards dispatches at once
+            await asyncio.sleep(0)
+            while len(pending) < self.max_batch and not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            deadline = loop.time() + self.wait_ms / 1000
+            while 1 < len(pending) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            self._batch_size_ema += self.BATCH_SIZE_SMOOTHING * (len(pending) - self._batch_size_ema)
+            
+            try:
+                results = await self.batch_fn([item for item, _ in pending])
+            except Exception as e:
+                if len(pending) == 1:
+                    self._settle(pending[0][1], exception=e)
+                else:
+                    await self._run_individually(pending)
+                continue
+            for (_, result), value in zip(pending, results):
+                self._settle(result, value)
+    
+    async def _run_individually(self, pending: List[Tuple[Any, asyncio.Future]]):
+        """Retry a failed batch one item at a time so only the offending items fail"""
+        for item, result in pending:
+            try:
+                value = (await self.batch_fn([item]))[0]
+            except Exception as e:
+                self._settle(result, exception=e)
+            else:
+                self._settle(result, value)
+    
+    @staticmethod
+    def _settle(result: asyncio.Future, value: Any = None, exception: Optional[BaseException] = None):
+        """Resolve a waiter unless it was already cancelled"""
+        if result.done():
+            return
+        if exception is not None:
+            result.set_exception(exception)
+        else:
+            result.set_result(value)
+
+
+__all__ = ["BatchScheduler"]
@@ -0,0 +1,108 @@
+"""
+Ochuko AI - Fused Face Model
+One shared backbone with macro-expression, micro-expression and eye heads,
+exported for the inference backends used by advanced_perception
+Author: David Akpoviroro Oke (MrIridescent)
+"""
+
+import logging
+import torch
+from torch import nn
+from typing import Tuple
+
+from advanced_perception import (
+    FACE_EYE_SLICE,
+    FACE_INPUT_SIZE,
+    FACE_MACRO_SLICE,
+    FACE_MICRO_SLICE,
+)
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_SIZE = 128
+
+
+def _conv_block(in_channels: int, out_channels: int, stride: int) -> nn.Sequential:
+    """Depthwise-separable 3x3 conv (MobileFaceNet building block)"""
+    return nn.Sequential(
+        nn.Conv2d(in_channels, in_channels, 3, stride, 1, groups=in_channels, bias=False),
+        nn.BatchNorm2d(in_channels),
+        nn.PReLU(in_channels),
+        nn.Conv2d(in_channels, out_channels, 1, bias=False),
+        nn.BatchNorm2d(out_channels),
+        nn.PReLU(out_channels),
+    )
+
+
+class FaceMultiHead(nn.Module):
+    """
+    MobileFaceNet-style backbone shared by three heads, so a face crop costs one
+    backbone pass instead of one per head.
+    
+    forward() returns the heads concatenated in the layout advanced_perception
+    splits (FACE_MACRO_SLICE | FACE_MICRO_SLICE | FACE_EYE_SLICE), which keeps the
+    exported graph to the single output tensor the inference backends expect.
+    """
+    
+    def __init__(self, embedding_size: int = EMBEDDING_SIZE):
+        super().__init__()
+        self.backbone = nn.Sequential(
+            nn.Conv2d(3, 64, 3, 2, 1, bias=False),
+            nn.BatchNorm2d(64),
+            nn.PReLU(64),
+            _conv_block(64, 64, 1),
+            _conv_block(64, 128, 2),
+            _conv_block(128, 128, 1),
+            _conv_block(128, 256, 2),
+            _conv_block(256, 256, 1),
+            _conv_block(256, 512, 2),
+            nn.AdaptiveAvgPool2d(1),
+            nn.Flatten(),
+            nn.Linear(512, embedding_size),
+            nn.BatchNorm1d(embedding_size),
+        )
+        self.macro_head = nn.Linear(embedding_size, FACE_MACRO_SLICE.stop - FACE_MACRO_SLICE.start)
+        self.micro_head = nn.Linear(embedding_size, FACE_MICRO_SLICE.stop - FACE_MICRO_SLICE.start)
+        self.eye_head = nn.Linear(embedding_size, FACE_EYE_SLICE.stop - FACE_EYE_SLICE.start)
+    
+    def analyze(self, x: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """(macro_logits, micro_logits, eye_regression) for a float32 NCHW batch in [0, 1]"""
+        embedding = self.backbone(x)
+        return self.macro_head(embedding), self.micro_head(embedding), self.eye_head(embedding)
+    
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return torch.cat(self.analyze(x), dim=1)
+
+
+def _example_input(batch_size: int = 1) -> torch.Tensor:
+    width, height = FACE_INPUT_SIZE
+    return torch.rand(batch_size, 3, height, width)
+
+
+def export_torchscript(model: FaceMultiHead, path: str):
+    """Trace the model for TorchScriptBackend"""
+    model.eval()
+    with torch.inference_mode():
+        torch.jit.trace(model, _example_input()).save(path)
+    logger.info("Exported TorchScript face model to %s", path)
+
+
+def export_onnx(model: FaceMultiHead, path: str, opset_version: int = 17):
+    """
+    Export with a dynamic batch axis, for TensorRT (trtexec), CUDA or CoreML runtimes.
+    inference_backends.quantize_onnx_int8 then builds the int8 variant for CPUs.
+    """
+    model.eval()
+    torch.onnx.export(
+        model,
+        _example_input(),
+        path,
+        input_names=["face"],
+        output_names=["outputs"],
+        dynamic_axes={"face": {0: "batch"}, "outputs": {0: "batch"}},
+        opset_version=opset_version,
+    )
+    logger.info("Exported ONNX face model to %s", path)
+
+
+__all__ = ["FaceMultiHead", "export_torchscript", "export_onnx"]
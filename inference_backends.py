@@ -0,0 +1,222 @@
+"""
+Ochuko AI - Inference Backends
+Swappable model runtimes (TorchScript, TensorRT, ONNX Runtime) behind a single infer() call
+Author: David Akpoviroro Oke (MrIridescent)
+"""
+
+import logging
+import os
+import numpy as np
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional, Protocol, Sequence, runtime_checkable
+
+logger = logging.getLogger(__name__)
+
+
+@runtime_checkable
+class InferenceBackend(Protocol):
+    """A loaded model that maps one float32 batch to one output array"""
+    
+    def infer(self, x: np.ndarray) -> np.ndarray:
+        ...
+
+
+class TorchScriptBackend:
+    """TorchScript module exported with torch.jit.save"""
+    
+    def __init__(self, model_path: str, device: str = "cpu"):
+        import torch
+        
+        self._torch = torch
+        self.device = torch.device(device)
+        self.module = torch.jit.load(model_path, map_location=self.device).eval()
+        logger.info("Loaded TorchScript model %s on %s", model_path, self.device)
+    
+    def infer(self, x: np.ndarray) -> np.ndarray:
+        torch = self._torch
+        batch = torch.from_numpy(np.ascontiguousarray(x, dtype=np.float32)).to(self.device)
+        with torch.inference_mode():
+            output = self.module(batch)
+        return output.float().cpu().numpy()
+
+
+class TensorRTBackend:
+    """
+    Serialized TensorRT engine (.plan) with one input and one output tensor.
+    
+    Engines are built offline for the target GPU, e.g.
+    `trtexec --onnx=model.onnx --saveEngine=model.plan --fp16` on Ampere,
+    `--bf16` on Hopper, or `--int8` with a calibration cache on older devices.
+    Device buffers are managed through torch's CUDA allocator.
+    """
+    
+    def __init__(self, plan_path: str, device: str = "cuda"):
+        import tensorrt as trt
+        import torch
+        
+        self._torch = torch
+        self.device = torch.device(device)
+        
+        with open(plan_path, "rb") as plan:
+            runtime = trt.Runtime(trt.Logger(trt.Logger.WARNING))
+            self.engine = runtime.deserialize_cuda_engine(plan.read())
+        if self.engine is None:
+            raise RuntimeError(f"Failed to deserialize TensorRT engine: {plan_path}")
+        self.context = self.engine.create_execution_context()
+        
+        names = [self.engine.get_tensor_name(i) for i in range(self.engine.num_io_tensors)]
+        self._input_name = next(
+            name for name in names if self.engine.get_tensor_mode(name) == trt.TensorIOMode.INPUT
+        )
+        self._output_name = next(
+            name for name in names if self.engine.get_tensor_mode(name) == trt.TensorIOMode.OUTPUT
+        )
+        self._stream = torch.cuda.Stream(device=self.device)
+        logger.info("Loaded TensorRT engine %s on %s", plan_path, self.device)
+    
+    def infer(self, x: np.ndarray) -> np.ndarray:
+        torch = self._torch
+        with torch.cuda.stream(self._stream):
+            batch = torch.from_numpy(np.ascontiguousarray(x, dtype=np.float32)).to(
+                self.device, non_blocking=True
+            )
+            self.context.set_input_shape(self._input_name, tuple(batch.shape))
+            output = torch.empty(
+                tuple(self.context.get_tensor_shape(self._output_name)),
+                dtype=torch.float32,
+                device=self.device
+            )
+            self.context.set_tensor_address(self._input_name, batch.data_ptr())
+            self.context.set_tensor_address(self._output_name, output.data_ptr())
+            self.context.execute_async_v3(self._stream.cuda_stream)
+        self._stream.synchronize()
+        return output.cpu().numpy()
+
+
+class OnnxRuntimeBackend:
+    """
+    ONNX model run through ONNX Runtime (CPU by default).
+    
+    Pass the FP32 export path; the best precision variant stored next to it
+    (see model_variant_path) is loaded instead when this CPU can use it.
+    """
+    
+    def __init__(self, model_path: str, providers: Optional[Sequence[str]] = None):
+        import onnxruntime as ort
+        
+        self.model_path = model_variant_path(model_path)
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            self.model_path,
+            sess_options=options,
+            providers=list(providers or ["CPUExecutionProvider"])
+        )
+        self._input_name = self.session.get_inputs()[0].name
+        logger.info("Loaded ONNX model %s on %s", self.model_path, self.session.get_providers())
+    
+    def infer(self, x: np.ndarray) -> np.ndarray:
+        batch = np.ascontiguousarray(x, dtype=np.float32)
+        return np.asarray(self.session.run(None, {self._input_name: batch})[0], dtype=np.float32)
+
+
+@lru_cache(maxsize=1)
+def cpu_flags() -> FrozenSet[str]:
+    """Instruction-set flags of this CPU (py-cpuinfo if installed, else /proc/cpuinfo)"""
+    try:
+        import cpuinfo
+        return frozenset(cpuinfo.get_cpu_info().get("flags", ()))
+    except ImportError:
+        pass
+    try:
+        with open("/proc/cpuinfo") as info:
+            for line in info:
+                if line.startswith("flags"):
+                    return frozenset(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return frozenset()
+
+
+def preferred_precision() -> str:
+    """
+    "int8" where ONNX Runtime's int8 GEMM kernels have VNNI dot-product
+    instructions to run on, otherwise "fp32"
+    """
+    flags = cpu_flags()
+    if "avx512_vnni" in flags or "avx_vnni" in flags:
+        return "int8"
+    return "fp32"
+
+
+def model_variant_path(model_path: str, precision: Optional[str] = None) -> str:
+    """
+    Path of the `precision` variant of an FP32 model (model.onnx -> model.int8.onnx),
+    falling back to the FP32 model when that variant was not built
+    """
+    precision = precision or preferred_precision()
+    if precision == "fp32":
+        return model_path
+    root, ext = os.path.splitext(model_path)
+    variant = f"{root}.{precision}{ext}"
+    return variant if os.path.exists(variant) else model_path
+
+
+def quantize_onnx_int8(
+    model_path: str,
+    calibration_batches: Iterable[np.ndarray],
+    output_path: Optional[str] = None
+) -> str:
+    """
+    Post-training static int8 quantization of an FP32 ONNX model.
+    
+    `calibration_batches` are representative float32 model inputs (a few hundred
+    samples in total, e.g. face crops); activations and weights are quantized to
+    QInt8 with per-channel weight scales. Writes the model.int8.onnx variant that
+    OnnxRuntimeBackend picks up on VNNI CPUs, and returns its path.
+    """
+    import onnxruntime as ort
+    from onnxruntime.quantization import (
+        CalibrationDataReader, QuantFormat, QuantType, quantize_static
+    )
+    
+    input_name = ort.InferenceSession(
+        model_path, providers=["CPUExecutionProvider"]
+    ).get_inputs()[0].name
+    
+    class _Calibration(CalibrationDataReader):
+        def __init__(self):
+            self._batches = iter(calibration_batches)
+        
+        def get_next(self):
+            batch = next(self._batches, None)
+            if batch is None:
+                return None
+            return {input_name: np.ascontiguousarray(batch, dtype=np.float32)}
+    
+    if output_path is None:
+        root, ext = os.path.splitext(model_path)
+        output_path = f"{root}.int8{ext}"
+    quantize_static(
+        model_path,
+        output_path,
+        _Calibration(),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QInt8,
+        weight_type=QuantType.QInt8,
+        per_channel=True
+    )
+    logger.info("Wrote int8 model %s", output_path)
+    return output_path
+
+
+__all__ = [
+    "InferenceBackend",
+    "TorchScriptBackend",
+    "TensorRTBackend",
+    "OnnxRuntimeBackend",
+    "cpu_flags",
+    "preferred_precision",
+    "model_variant_path",
+    "quantize_onnx_int8",
+]
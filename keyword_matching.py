@@ -0,0 +1,77 @@
+"""
+Ochuko AI - Keyword Matching
+Multi-keyword substring search over lowercased text
+Author: David Akpoviroro Oke (MrIridescent)
+"""
+
+from typing import Any, Collection, Dict, List, Mapping, Set
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+CODEGEN_MAX_KEYWORDS = 64  # Above this, an Aho-Corasick automaton beats inlined `in` checks
+
+
+class KeywordMatcher:
+    """
+    Substring matcher from keywords to the labels that own them.
+    
+    Small, fixed keyword tables are compiled at construction into a specialized
+    function of straight-line `kw in text` checks (no dict iteration or
+    generator overhead). Large tables use a single-pass Aho-Corasick automaton
+    when pyahocorasick is installed.
+    """
+    
+    def __init__(self, labeled_keywords: Mapping[str, Collection[str]]):
+        labels_by_keyword: Dict[str, List[str]] = {}
+        for label, keywords in labeled_keywords.items():
+            for keyword in keywords:
+                labels_by_keyword.setdefault(keyword, []).append(label)
+        
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and len(labels_by_keyword) > CODEGEN_MAX_KEYWORDS:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, labels in labels_by_keyword.items():
+                self._automaton.add_word(keyword, tuple(labels))
+            self._automaton.make_automaton()
+        else:
+            self._find, self._contains_any = self._compile(labeled_keywords)
+    
+    @staticmethod
+    def _compile(labeled_keywords: Mapping[str, Collection[str]]):
+        """Generate `_find(t)` / `_contains_any(t)` with every keyword inlined as a constant"""
+        find_lines = ["def _find(t):", "    found = set()"]
+        for label, keywords in labeled_keywords.items():
+            if keywords:
+                condition = " or ".join(f"{keyword!r} in t" for keyword in keywords)
+                find_lines.append(f"    if {condition}: found.add({label!r})")
+        find_lines.append("    return found")
+        
+        all_keywords = list(dict.fromkeys(kw for keywords in labeled_keywords.values() for kw in keywords))
+        any_condition = " or ".join(f"{keyword!r} in t" for keyword in all_keywords) or "False"
+        any_lines = ["def _contains_any(t):", f"    return {any_condition}"]
+        
+        namespace: Dict[str, Any] = {}
+        exec("\n".join(find_lines + any_lines), namespace)
+        return namespace["_find"], namespace["_contains_any"]
+    
+    def find(self, text_lower: str) -> Set[str]:
+        """Labels with at least one keyword occurring in the (lowercased) text"""
+        if self._automaton is None:
+            return self._find(text_lower)
+        found: Set[str] = set()
+        for _, labels in self._automaton.iter(text_lower):
+            found.update(labels)
+        return found
+    
+    def contains_any(self, text_lower: str) -> bool:
+        if self._automaton is None:
+            return self._contains_any(text_lower)
+        return next(self._automaton.iter(text_lower), None) is not None
+
+
+__all__ = ["KeywordMatcher", "AHOCORASICK_AVAILABLE", "CODEGEN_MAX_KEYWORDS"]
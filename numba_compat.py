@@ -0,0 +1,21 @@
+"""
+Ochuko AI - Numba Compatibility Layer
+JIT compilation for numeric kernels, with a pure-Python fallback
+Author: David Akpoviroro Oke (MrIridescent)
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit: kernels run as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
@@ -0,0 +1,65 @@
+"""
+Tests for the Advanced Reasoning Engine's sub-engine memoization
+Verifies memo keys are faithful to their inputs
+"""
+
+import pytest
+import numpy as np
+
+from advanced_reasoning_engine import AdvancedReasoningEngine, _cache_key
+
+
+class TestCacheKey:
+    """_cache_key digests must differ whenever the inputs differ"""
+    
+    def test_dict_key_order_is_ignored(self):
+        assert _cache_key("detect", {"b": 1, "a": 2}) == _cache_key("detect", {"a": 2, "b": 1})
+    
+    def test_mixed_key_types_are_distinct(self):
+        assert _cache_key("detect", {1: "a"}) != _cache_key("detect", {"1": "a"})
+        assert _cache_key("detect", {1: "a", "b": 2}) is not None
+    
+    def test_arrays_differing_only_in_the_middle(self):
+        first = np.zeros(2000)
+        second = first.copy()
+        second[1000] = 1.0
+        # The two reprs are identical: NumPy elides the middle of large arrays
+        assert repr(first) == repr(second)
+        
+        first_key = _cache_key("detect", [{"type": "physiological", "value": first}])
+        second_key = _cache_key("detect", [{"type": "physiological", "value": second}])
+        
+        assert first_key is not None and second_key is not None
+        assert first_key != second_key
+    
+    def test_equal_arrays_share_a_key(self):
+        assert _cache_key("detect", np.arange(10)) == _cache_key("detect", np.arange(10))
+        assert _cache_key("detect", np.arange(10)) != _cache_key("detect", np.arange(10.0))
+    
+    def test_non_json_inputs_are_not_memoized(self):
+        assert _cache_key("detect", [{"type": "vocal", "pattern": object()}]) is None
+
+
+class TestMemoization:
+    """Observations that differ get their own sub-engine results"""
+    
+    @pytest.mark.asyncio
+    async def test_large_arrays_are_not_confused(self):
+        engine = AdvancedReasoningEngine()
+        calls = []
+        detect = engine.pattern_recognizer.detect_batch
+        
+        async def spy(batch):
+            calls.append(len(batch))
+            return await detect(batch)
+        engine._detect_batcher.batch_fn = spy
+        
+        first = np.zeros(2000)
+        second = first.copy()
+        second[1000] = 1.0
+        for value in (first, second, first):
+            await engine.forensic_chain_of_thought(
+                "subject", [{"type": "physiological", "measure": "hr", "value": value}], {}
+            )
+        
+        assert calls == [1, 1]
@@ -0,0 +1,171 @@
+"""
+Tests for the request batching scheduler
+Verifies coalescing, result ordering, error isolation and the adaptive window
+"""
+
+import pytest
+import asyncio
+
+from batching import BatchScheduler
+
+
+class RecordingBatchFn:
+    """batch_fn that records every batch it sees and doubles its inputs"""
+    
+    def __init__(self, fail_on=()):
+        self.batches = []
+        self.fail_on = set(fail_on)
+    
+    async def __call__(self, items):
+        self.batches.append(list(items))
+        if self.fail_on.intersection(items):
+            raise ValueError(f"bad item in {items}")
+        return [item * 2 for item in items]
+
+
+class TestCoalescing:
+    """Concurrent submissions share one batch_fn call"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_coalesce(self):
+        batch_fn = RecordingBatchFn()
+        scheduler = BatchScheduler(batch_fn, max_batch=16, max_wait_ms=50.0)
+        
+        results = await asyncio.gather(*(scheduler.submit(i) for i in range(10)))
+        
+        assert results == [i * 2 for i in range(10)]
+        assert len(batch_fn.batches) == 1
+        assert sorted(batch_fn.batches[0]) == list(range(10))
+    
+    @pytest.mark.asyncio
+    async def test_batches_never_exceed_max_batch(self):
+        batch_fn = RecordingBatchFn()
+        scheduler = BatchScheduler(batch_fn, max_batch=4, max_wait_ms=50.0)
+        
+        results = await asyncio.gather(*(scheduler.submit(i) for i in range(10)))
+        
+        assert results == [i * 2 for i in range(10)]
+        assert all(len(batch) <= 4 for batch in batch_fn.batches)
+        assert sum(len(batch) for batch in batch_fn.batches) == 10
+    
+    @pytest.mark.asyncio
+    async def test_worker_restarts_on_new_loop(self):
+        batch_fn = RecordingBatchFn()
+        scheduler = BatchScheduler(batch_fn)
+        
+        assert await scheduler.submit(1) == 2
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, asyncio.run, scheduler.submit(3)
+        )
+        assert result == 6
+    
+    @pytest.mark.asyncio
+    async def test_lone_request_skips_the_window(self):
+        batch_fn = RecordingBatchFn()
+        scheduler = BatchScheduler(batch_fn, max_batch=16, max_wait_ms=500.0)
+        loop = asyncio.get_running_loop()
+        
+        start = loop.time()
+        for i in range(3):
+            assert await scheduler.submit(i) == i * 2
+        
+        assert loop.time() - start < 0.25
+        assert batch_fn.batches == [[0], [1], [2]]
+
+
+class TestOrdering:
+    """Every caller gets the result for its own item"""
+    
+    @pytest.mark.asyncio
+    async def test_results_match_submitted_items(self):
+        async def tagged(items):
+            await asyncio.sleep(0)
+            return [f"result-{item}" for item in items]
+        
+        scheduler = BatchScheduler(tagged, max_batch=8, max_wait_ms=20.0)
+        items = [5, 3, 9, 1, 7, 2, 8, 4, 6, 0, 11]
+        
+        results = await asyncio.gather(*(scheduler.submit(i) for i in items))
+        
+        assert results == [f"result-{i}" for i in items]
+    
+    @pytest.mark.asyncio
+    async def test_batch_preserves_submission_order(self):
+        batch_fn = RecordingBatchFn()
+        scheduler = BatchScheduler(batch_fn, max_batch=16, max_wait_ms=50.0)
+        
+        await asyncio.gather(*(scheduler.submit(i) for i in range(6)))
+        
+        assert batch_fn.batches[0] == list(range(6))
+
+
+class TestErrorIsolation:
+    """A failing item only fails its own caller"""
+    
+    @pytest.mark.asyncio
+    async def test_bad_item_does_not_fail_batch_mates(self):
+        batch_fn = RecordingBatchFn(fail_on={3})
+        scheduler = BatchScheduler(batch_fn, max_batch=16, max_wait_ms=50.0)
+        
+        results = await asyncio.gather(
+            *(scheduler.submit(i) for i in range(6)), return_exceptions=True
+        )
+        
+        assert isinstance(results[3], ValueError)
+        assert [r for i, r in enumerate(results) if i != 3] == [0, 2, 4, 8, 10]
+    
+    @pytest.mark.asyncio
+    async def test_lone_failure_is_raised(self):
+        scheduler = BatchScheduler(RecordingBatchFn(fail_on={1}))
+        
+        with pytest.raises(ValueError):
+            await scheduler.submit(1)
+    
+    @pytest.mark.asyncio
+    async def test_scheduler_keeps_serving_after_failure(self):
+        scheduler = BatchScheduler(RecordingBatchFn(fail_on={1}))
+        
+        with pytest.raises(ValueError):
+            await scheduler.submit(1)
+        assert await scheduler.submit(2) == 4
+
+
+class TestAdaptiveWindow:
+    """The batching window follows the observed batch sizes"""
+    
+    def test_fixed_window_without_base(self):
+        scheduler = BatchScheduler(RecordingBatchFn(), max_batch=16, max_wait_ms=8.0)
+        assert scheduler.wait_ms == 8.0
+    
+    def test_idle_window_starts_at_base(self):
+        scheduler = BatchScheduler(
+            RecordingBatchFn(), max_batch=16, max_wait_ms=32.0, base_wait_ms=4.0
+        )
+        assert scheduler.wait_ms == pytest.approx(4.0)
+    
+    @pytest.mark.asyncio
+    async def test_window_grows_with_load(self):
+        scheduler = BatchScheduler(
+            RecordingBatchFn(), max_batch=8, max_wait_ms=32.0, base_wait_ms=4.0
+        )
+        
+        for _ in range(20):
+            await asyncio.gather(*(scheduler.submit(i) for i in range(8)))
+        
+        assert scheduler.wait_ms > 24.0
+        assert scheduler.wait_ms <= 32.0
+    
+    @pytest.mark.asyncio
+    async def test_window_shrinks_when_load_drops(self):
+        scheduler = BatchScheduler(
+            RecordingBatchFn(), max_batch=8, max_wait_ms=32.0, base_wait_ms=4.0
+        )
+        for _ in range(20):
+            await asyncio.gather(*(scheduler.submit(i) for i in range(8)))
+        loaded = scheduler.wait_ms
+        
+        for i in range(20):
+            await scheduler.submit(i)
+        
+        assert scheduler.wait_ms < loaded
+        assert scheduler.wait_ms < 6.0